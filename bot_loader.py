@@ -1,7 +1,32 @@
 import asyncio
 
+import aiohttp
+from better_proxy import Proxy
+
 from src.utils import load_config, AccountProgress
 
 config = load_config()
 semaphore = asyncio.Semaphore(config.threads)
-progress = AccountProgress(len(config.accounts))
\ No newline at end of file
+progress = AccountProgress(len(config.accounts))
+
+_shared_sessions: dict[tuple[str, str | None], aiohttp.ClientSession] = {}
+
+
+def get_shared_session(rpc_url: str, proxy: Proxy | None = None) -> aiohttp.ClientSession:
+    key = (str(rpc_url), proxy.as_url if proxy else None)
+    session = _shared_sessions.get(key)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=60)
+        )
+        _shared_sessions[key] = session
+    return session
+
+
+async def close_shared_sessions() -> None:
+    sessions = list(_shared_sessions.values())
+    _shared_sessions.clear()
+    await asyncio.gather(
+        *(session.close() for session in sessions if not session.closed),
+        return_exceptions=True
+    )
@@ -28,6 +28,13 @@ TOKENS_DATA_SOMNIA = {
     "USDC": "0xE9CC37904875B459Fa5D0FE37680d36F1ED55e38",
 }
 
+"""--------------------------------- Multicall3 ----------------------------"""
+MULTICALL3_ADDRESSES = {                                            # Адрес Multicall3 по chain_id
+    50312: "0x841b8199E6d3Db3C6f264f6C2bd8848b3cA64223",            # Somnia Testnet
+}
+# Перед первым использованием проверяется, что по адресу есть код.
+# Если сети нет в списке или контракт не найден, вызовы выполняются по одному
+
 """--------------------------------- QuickSwap Pool ----------------------------"""
 # Только пара ["STT" "USDC"]
 LOWER_TOKEN_PERCENTAGE_QUICK_POOL = 0                               # Процент количества токенов от токена с меньшим балансом
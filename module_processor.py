@@ -11,7 +11,7 @@ from src.db.models import SummaryStatistics
 from bot_loader import config, progress, semaphore
 from src.logger import AsyncLogger
 from src.models import Account
-from src.utils import get_address, random_sleep
+from src.utils import get_address, random_sleep, flush_excel_updates
 from src.utils.send_tg_message import SendTgMessage
 from src.db.database_operations import DatabaseError
 
@@ -343,16 +343,16 @@ class ModuleProcessor(AsyncLogger):
                     address=address, method_name="process_route_execution"
                 )
 
-        batch_size = config.threads
-        for i in range(0, len(config.accounts), batch_size):
-            batch = config.accounts[i : i + batch_size]
+        route_semaphore = asyncio.Semaphore(config.threads)
 
-            async with asyncio.TaskGroup() as tg:
-                for account in batch:
-                    tg.create_task(process_account(account))
+        async def process_account_bounded(account: Account) -> None:
+            async with route_semaphore:
+                await process_account(account)
 
-            if i + batch_size < len(config.accounts):
-                await asyncio.sleep(0.5)
+        async with asyncio.TaskGroup() as tg:
+            for account in config.accounts:
+                tg.create_task(process_account_bounded(account))
+        await flush_excel_updates()
 
         if config.send_stats_to_telegram and config.accounts:
             try:
@@ -590,6 +590,7 @@ class ModuleProcessor(AsyncLogger):
                         tasks.append(tg.create_task(process_account(account)))
                     
                 results = [task.result() for task in tasks]
+                await flush_excel_updates()
                 
                 await self.logger_msg("Cleaning up resources...", type_msg="debug")
                 for task in asyncio.all_tasks():
@@ -2,8 +2,9 @@ import asyncio
 import os
 import sys
 
-from bot_loader import progress
+from bot_loader import progress, close_shared_sessions
 from src.db import Database
+from src.utils import flush_excel_updates
 from module_processor import ModuleProcessor
 from src.logger import AsyncLogger
 
@@ -33,7 +34,9 @@ async def main_loop() -> None:
         input("\nPress Enter to return to menu...")
         os.system("cls" if os.name == "nt" else "clear")
 
+    await flush_excel_updates()
     await Database.close_pool()
+    await close_shared_sessions()
     await logger.logger_msg("👋 Goodbye! Terminal is ready for commands.", type_msg="info")
 
 async def shutdown(loop):
@@ -18,6 +18,9 @@ from src.exceptions.api_exceptions import (
 )
 
 
+_SSL_CONTEXT = ssl_module.create_default_context(cafile=certifi.where())
+
+
 class BaseAPIClient:
     RETRYABLE_ERRORS = (
         APIServerSideError,
@@ -40,9 +43,13 @@ class BaseAPIClient:
         self._lock: asyncio.Lock = asyncio.Lock()
         self._session_active: bool = False
         self._headers: dict[str, str | bool | list[str]] = self._generate_headers()
-        self._ssl_context = ssl_module.create_default_context(cafile=certifi.where())
+        self._ssl_context = _SSL_CONTEXT
         self._connector: aiohttp.TCPConnector = self._create_connector()
         
+    @property
+    def ssl_context(self) -> ssl_module.SSLContext:
+        return self._ssl_context
+        
     @staticmethod
     def _generate_headers() -> dict[str, str | bool | list[str]]:
         user_agent = ua_generator.generate(
@@ -64,7 +71,9 @@ class BaseAPIClient:
             enable_cleanup_closed=True,
             force_close=False,
             ssl=self._ssl_context,
-            limit=10
+            limit=100,
+            limit_per_host=10,
+            keepalive_timeout=30
         )
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -77,6 +86,21 @@ class BaseAPIClient:
             )
         return self.session
 
+    async def ensure_session_connected(self, verify: bool = True) -> None:
+        session = await self._get_session()
+        try:
+            # Opens a pooled keep-alive connection to the origin; ssl must match the later requests
+            async with session.head(
+                str(URL(self.base_url).origin()),
+                proxy=self.proxy.as_url if self.proxy else None,
+                ssl=self._ssl_context if verify else False,
+                allow_redirects=False,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ):
+                pass
+        except Exception:
+            pass
+
     async def _check_session_valid(self) -> bool:
         if self.session is None or self.session.closed:
             return False
@@ -145,6 +169,11 @@ class BaseAPIClient:
         if user_agent:
             custom_headers['user-agent'] = user_agent
             
+        if json_data is not None:
+            data = orjson.dumps(json_data)
+            if not any(key.lower() == 'content-type' for key in custom_headers):
+                custom_headers['content-type'] = 'application/json'
+            
         ssl_param = self._ssl_context if verify else False
         if isinstance(ssl, ssl_module.SSLContext):
             ssl_param = ssl
@@ -164,7 +193,6 @@ class BaseAPIClient:
                     async with session.request(
                         method=request_type,
                         url=target_url,
-                        json=json_data,
                         data=data,
                         params=params,
                         headers=merged_headers,
@@ -13,6 +13,14 @@ class InsufficientFundsError(WalletError):
     Occurs when the wallet balance is insufficient to complete the operation.
     """
 
+
+class PoolNotFoundError(Exception):
+    """
+    Exception for a token pair without a liquidity pool.
+
+    Occurs when the pool factory returns the zero address for the pair.
+    """
+
 class ConfigurationError(Exception):
     """
     Base class for configuration errors.
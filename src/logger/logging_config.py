@@ -5,7 +5,6 @@ import asyncio
 from pathlib import Path
 from typing import Literal
 
-import aiofiles
 from aiologger import Logger
 from aiologger.levels import LogLevel
 from aiologger.handlers.base import Handler
@@ -41,6 +40,11 @@ class FileFormatter:
         )
 
 
+def _append_line(file_path: str, line: str) -> None:
+    with open(file_path, mode="a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
 class AsyncLevelFileHandler(Handler):
     def __init__(self, base_name: str = "file", level=LogLevel.DEBUG) -> None:
         super().__init__(level=level)
@@ -62,8 +66,7 @@ class AsyncLevelFileHandler(Handler):
         if not self.initialized:
             await self.initialize()
         message = self.formatter.format(record)
-        async with aiofiles.open(self.file_path, mode="a", encoding="utf-8") as f:
-            await f.write(message + "\n")
+        await asyncio.to_thread(_append_line, self.file_path, message)
 
     async def close(self) -> None:
         self._initialized = False
@@ -154,6 +157,9 @@ class AsyncLogger:
         class_name: str | None = None,
         method_name: str | None = None,
     ) -> None:
+        if type_msg == "debug" and not self._logger.is_enabled_for(LogLevel.DEBUG):
+            return
+        
         if class_name is None:
             class_name = self.__class__.__name__
             if class_name == "AsyncLogger" and type(self) != AsyncLogger:
@@ -5,7 +5,6 @@ from pathlib import Path
 from web3 import AsyncWeb3
 from typing import Any, ClassVar
 
-import aiofiles
 import orjson
 
 class ContractError(Exception):
@@ -23,6 +22,8 @@ class BaseContract:
     CACHE_TTL: ClassVar[int] = 3600
 
     async def get_abi(self) -> list[dict[str, Any]]:
+        if (cached := self._abi_cache.get(self.abi_file)) and (time.time() - cached[1]) < self.CACHE_TTL:
+            return cached[0]
         async with self._cache_lock:
             await self._validate_cache()
             return self._abi_cache[self.abi_file][0]
@@ -36,12 +37,11 @@ class BaseContract:
     async def _load_abi_file(self, timestamp: float) -> None:
         file_path = self._abi_path / self.abi_file
         try:
-            async with aiofiles.open(file_path, "rb") as f:
-                content = await asyncio.to_thread(file_path.read_bytes)
-                abi_data = orjson.loads(content)
-                if not isinstance(abi_data, list):
-                    raise ContractError(f"Invalid ABI structure in {file_path}")
-                self._abi_cache[self.abi_file] = (abi_data, timestamp)
+            content = await asyncio.to_thread(file_path.read_bytes)
+            abi_data = orjson.loads(content)
+            if not isinstance(abi_data, list):
+                raise ContractError(f"Invalid ABI structure in {file_path}")
+            self._abi_cache[self.abi_file] = (abi_data, timestamp)
         except FileNotFoundError as e:
             raise ContractError(f"ABI file not found: {file_path}") from e
         except orjson.JSONDecodeError as e:
@@ -84,12 +84,10 @@ class ERC20Contract(BaseContract):
                 return self._bytecode
             file_path = self._bytecode_path / self._bytecode_file
             try:
-                async with aiofiles.open(file_path, "r") as f:
-                    bytecode = await f.read()
-                    bytecode = bytecode.strip()
-                    self._bytecode_cache[cache_key] = bytecode
-                    self._bytecode = bytecode
-                    return bytecode
+                bytecode = (await asyncio.to_thread(file_path.read_text)).strip()
+                self._bytecode_cache[cache_key] = bytecode
+                self._bytecode = bytecode
+                return bytecode
             except FileNotFoundError as e:
                 raise ContractError(f"Bytecode not found: {file_path}") from e
             except Exception as e:
@@ -182,4 +180,9 @@ class QuickSwapAddressPairContract(BaseContract):
 @dataclass(slots=True)
 class QuickPoolContract(BaseContract):
     address: str = AsyncWeb3.to_checksum_address("0x37A4950b4ea0C46596404895c5027B088B0e70e7")
-    abi_file: str = "quick_pool.json"
\ No newline at end of file
+    abi_file: str = "quick_pool.json"
+    
+@dataclass(slots=True)
+class Multicall3Contract(BaseContract):
+    address: str
+    abi_file: str = "multicall3.json"
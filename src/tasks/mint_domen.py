@@ -1,8 +1,7 @@
-from typing import Self
+from typing import ClassVar, Self
 
 from web3 import AsyncWeb3
 from faker import Faker
-import re
 
 from src.api import BaseAPIClient
 from src.wallet import Wallet
@@ -14,13 +13,14 @@ from config.settings import MAX_RETRY_ATTEMPTS, RETRY_SLEEP_RANGE
 
 
 class MintDomenModule(Wallet, AsyncLogger):
+    _FAKER: ClassVar[Faker] = Faker()
+
     def __init__(self, account: Account) -> None:
         Wallet.__init__(self, account.private_key, config.somnia_rpc, account.proxy)
         AsyncLogger.__init__(self)
         self.api_client = BaseAPIClient(
             "https://contracts-api.mintair.xyz/api", account.proxy
-        )        
-        self.faker = Faker()
+        )
         
     async def __aenter__(self) -> Self:
         await Wallet.__aenter__(self)
@@ -39,8 +39,7 @@ class MintDomenModule(Wallet, AsyncLogger):
 
     async def generate_domain_name(self):
         while True:
-            domain_name = self.faker.domain_name()
-            name = re.split(r'\.', domain_name)[0]
+            name = self._FAKER.domain_name().partition('.')[0]
             if len(name) > 5:
                 return name
             
@@ -1,10 +1,16 @@
 import asyncio
 import time
-from typing import Self, Union, Any
+from fractions import Fraction
+from functools import lru_cache
+from typing import Self, Union, Any, NamedTuple
+
+from eth_utils import function_signature_to_4byte_selector
+from web3 import AsyncWeb3
 
 from src.wallet import Wallet
-from bot_loader import config
+from bot_loader import config, get_shared_session
 from src.logger import AsyncLogger
+from src.exceptions.custom_exceptions import PoolNotFoundError
 from src.models import (
     Account, 
     QuickSwapRouterContract,
@@ -12,10 +18,17 @@ from src.models import (
     QuickSwapAddressPairContract,
     QuickPoolContract
 )
-from src.utils import show_trx_log, random_sleep
+from src.utils import (
+    show_trx_log,
+    batch_call,
+    get_multicall,
+    backoff_sleep,
+    is_retryable,
+    compute_amount_out,
+    pool_cache
+)
 from config.settings import (
     MAX_RETRY_ATTEMPTS, 
-    RETRY_SLEEP_RANGE,
     PAIR_QUICK_SWAP,
     TOKENS_DATA_SOMNIA,
     LOWER_TOKEN_PERCENTAGE_QUICK_POOL,
@@ -23,123 +36,150 @@ from config.settings import (
 )
 
 
+TOKENS_CHECKSUM_SOMNIA = {
+    name: AsyncWeb3.to_checksum_address(address)
+    for name, address in TOKENS_DATA_SOMNIA.items()
+}
+
+_UNWRAP_SELECTOR = function_signature_to_4byte_selector("unwrapWNativeToken(uint256,address)").hex()
+_REFUND_NATIVE_TOKEN_CALLDATA = "0x41865270"
+
+class RouteSpec(NamedTuple):
+    token_in: str
+    token_out: str
+    wrap_value: bool
+    unwrap_after: bool
+
+
+@lru_cache(maxsize=None)
+def _route_for(name_token1: str, name_token2: str) -> RouteSpec:
+    wrapped_native = TOKENS_CHECKSUM_SOMNIA["WSTT"]
+    return RouteSpec(
+        token_in=wrapped_native if name_token1 == "STT" else TOKENS_CHECKSUM_SOMNIA[name_token1],
+        token_out=wrapped_native if name_token2 == "STT" else TOKENS_CHECKSUM_SOMNIA[name_token2],
+        wrap_value=name_token1 == "STT",
+        unwrap_after=name_token2 == "STT"
+    )
+
+
 class QuickSwapModule(Wallet, AsyncLogger):
     def __init__(self, account: Account) -> None:
         Wallet.__init__(self, account.private_key, config.somnia_rpc, account.proxy)
         AsyncLogger.__init__(self)
+        self._rpc_proxy = account.proxy
         self.slippage = 1
+        self._recipient_word = self.wallet_address[2:].lower().zfill(64)
 
     async def __aenter__(self) -> Self:
         await Wallet.__aenter__(self)
+        await self.use_shared_session(get_shared_session(config.somnia_rpc, self._rpc_proxy))
+        await pool_cache.load()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await pool_cache.flush()
         await Wallet.__aexit__(self, exc_type, exc_val, exc_tb)
         
-    async def check_config_quick_swap(self, pair_swap) -> tuple[bool, str]:
-        await self.logger_msg("Checking swap configuration", "info", self.wallet_address)
+    async def _pair_address(self, contract_factory, token_a: str, token_b: str) -> str:
+        if (pair_address := pool_cache.get_pair(token_a, token_b)) is None:
+            pair_address = await contract_factory.functions.poolByPair(token_a, token_b).call()
+            if pair_address == self.ZERO_ADDRESS:
+                raise PoolNotFoundError(f"Pool for {token_a} - {token_b} does not exist")
+            pool_cache.set_pair(token_a, token_b, pair_address)
+        return pair_address
+    
+    async def _balance_call(self, multicall, token_address: str):
+        if self._is_native_token(token_address):
+            return multicall.functions.getEthBalance(self.wallet_address)
+        contract = await self.get_contract(token_address)
+        return contract.functions.balanceOf(self.wallet_address)
         
+    @staticmethod
+    def _validate_pairs(pair_swap) -> tuple[bool, str, bool]:
         has_active_pairs = False
         for pair_id, swap_data in pair_swap.items():
             if len(swap_data) != 3:
-                error_msg = f"Pair {pair_id}: Invalid format. Expected [token_out, token_in, min_amount]"
-                await self.logger_msg(error_msg, "error", self.wallet_address, "check_config_quick_swap")
-                return False, error_msg
+                return False, f"Pair {pair_id}: Invalid format. Expected [token_out, token_in, min_amount]", has_active_pairs
 
             token_out, token_in, min_amount = swap_data
 
             if not (token_out or token_in):
                 if min_amount != 0:
-                    error_msg = f"Pair {pair_id}: Empty pair requires min_amount = 0"
-                    await self.logger_msg(error_msg, "error", self.wallet_address, "check_config_quick_swap")
-                    return False, error_msg
+                    return False, f"Pair {pair_id}: Empty pair requires min_amount = 0", has_active_pairs
                 continue
 
             has_active_pairs = True
             
-            if not all((token_out, token_in)):
-                error_msg = f"Pair {pair_id}: Partial configuration. Out: '{token_out}', In: '{token_in}'"
-                await self.logger_msg(error_msg, "error", self.wallet_address, "check_config_quick_swap")
-                return False, error_msg
+            if not token_out or not token_in:
+                return False, f"Pair {pair_id}: Partial configuration. Out: '{token_out}', In: '{token_in}'", has_active_pairs
 
-            if not all(isinstance(t, str) for t in (token_out, token_in)):
-                error_msg = f"Pair {pair_id}: Invalid token types. Must be strings"
-                await self.logger_msg(error_msg, "error", self.wallet_address, "check_config_quick_swap")
-                return False, error_msg
+            if type(token_out) is not str or type(token_in) is not str:
+                return False, f"Pair {pair_id}: Invalid token types. Must be strings", has_active_pairs
 
             if token_out.lower() == token_in.lower():
-                error_msg = f"Pair {pair_id}: Same tokens ({token_out}/{token_in})"
-                await self.logger_msg(error_msg, "error", self.wallet_address, "check_config_quick_swap")
-                return False, error_msg
+                return False, f"Pair {pair_id}: Same tokens ({token_out}/{token_in})", has_active_pairs
 
             if not isinstance(min_amount, (int, float)) or min_amount <= 0:
-                error_msg = f"Pair {pair_id}: Invalid percentage {min_amount}. Must be > 0"
-                await self.logger_msg(error_msg, "error", self.wallet_address, "check_config_quick_swap")
-                return False, error_msg
+                return False, f"Pair {pair_id}: Invalid percentage {min_amount}. Must be > 0", has_active_pairs
 
         if not has_active_pairs:
-            error_msg = "No active swap pairs configured. Add at least one valid pair"
-            await self.logger_msg(error_msg, "error", self.wallet_address, "check_config_quick_swap")
-            return False, error_msg
+            return False, "No active swap pairs configured. Add at least one valid pair", has_active_pairs
+
+        return True, "Config validation passed", has_active_pairs
+        
+    async def check_config_quick_swap(self, pair_swap) -> tuple[bool, str]:
+        await self.logger_msg("Checking swap configuration", "info", self.wallet_address)
+        
+        status, msg, has_active_pairs = self._validate_pairs(pair_swap)
+        if not (status and has_active_pairs):
+            await self.logger_msg(msg, "error", self.wallet_address, "check_config_quick_swap")
+            return False, msg
 
         if (balance := await self.human_balance()) <= 0:
             error_msg = "No $STT tokens in wallet. Deposit required"
             await self.logger_msg(error_msg, "error", self.wallet_address, "check_config_quick_swap")
             return False, error_msg
 
-        return True, "Config validation passed"
+        return True, msg
     
-    async def swap(self, name_token1, name_token2, amount_in) -> tuple[bool, str]:
+    async def swap(self, name_token1, name_token2, amount_in, deadline: int | None = None) -> tuple[bool, str]:
+        if deadline is None:
+            deadline = int(time.time()) + 12 * 3600
+        
         for attempt in range(MAX_RETRY_ATTEMPTS):
             try:
                 contract_router = await self.get_contract(QuickSwapRouterContract())
                 contract_router_address = self._get_checksum_address(QuickSwapRouterContract().address)  
                 contract_factory = await self.get_contract(QuickSwapFactoryContract())
                  
-                address_token1 = self._get_checksum_address(TOKENS_DATA_SOMNIA.get(name_token1))
-                address_token2 = self._get_checksum_address(TOKENS_DATA_SOMNIA.get(name_token2))
-                
-                deadline = int(time.time() + 12 * 3600)
+                route = _route_for(name_token1, name_token2)
+                if not (route.wrap_value or route.unwrap_after):
+                    error_msg =f"For the pair {name_token1} - {name_token2} there is not enough liquidity in the pools, choose another pair"
+                    return False, error_msg
+                token_in, token_out = route.token_in, route.token_out
                 
                 await self.logger_msg("Get the address of the pool", "info", self.wallet_address)
-                if name_token1 == "STT":
-                    pair_address = await contract_factory.functions.poolByPair(self._get_checksum_address(TOKENS_DATA_SOMNIA.get("WSTT")), address_token2).call()
-                elif name_token2 == "STT":
-                    pair_address = await contract_factory.functions.poolByPair(address_token1, self._get_checksum_address(TOKENS_DATA_SOMNIA.get("WSTT"))).call()
-                else:
-                    pair_address = await contract_factory.functions.poolByPair(address_token1, address_token2).call()
+                pair_address = await self._pair_address(contract_factory, token_in, token_out)
                     
                 pool_contract = await self.get_contract(QuickSwapAddressPairContract(self._get_checksum_address(pair_address)))
                 await self.logger_msg("Calculating the amounts", "info", self.wallet_address)
                 sqrt_price, _, last_fee, _, _, _, _ = await pool_contract.functions.safelyGetStateOfAMM().call()
 
-                if name_token1 == "STT":
-                    token_in = self._get_checksum_address(TOKENS_DATA_SOMNIA.get("WSTT"))
-                    token_out = address_token2
-                elif name_token2 == "STT":
-                    token_in = address_token1
-                    token_out = self._get_checksum_address(TOKENS_DATA_SOMNIA.get("WSTT"))
-                else:
-                    token_in = address_token1
-                    token_out = address_token2
-
-                zero_to_one = token_in < token_out
+                token_in_lc = token_in.lower()
+                token_out_lc = token_out.lower()
+                zero_to_one = token_in_lc < token_out_lc
 
-                price = (sqrt_price / (2 ** 96)) ** 2
-                if zero_to_one:
-                    amount_out = amount_in * price * (1 - last_fee / 1000000)
-                else:
-                    amount_out = amount_in / price * (1 - last_fee / 1000000)
+                amount_out = compute_amount_out(sqrt_price, last_fee, amount_in, zero_to_one)
 
-                amount_out_min = int(amount_out * (1 - 0.5/100))
+                amount_out_min = amount_out * 995 // 1000
                 
-                if token_in != "0x0000000000000000000000000000000000000000":
+                if token_in_lc != self.ZERO_ADDRESS:
                     status, result = await self._check_and_approve_token(token_in, contract_router_address, amount_in)
                     if not status:
                         return False, result    
                 
                 await self.logger_msg("Sending the transaction", "info", self.wallet_address)
-                if name_token1 == "STT":        
+                if route.wrap_value:
                     tx_params = await self.build_transaction_params(
                         contract_router.functions.exactInputSingle([
                             token_in,
@@ -154,7 +194,7 @@ class QuickSwapModule(Wallet, AsyncLogger):
                         value=amount_in
                     )
                 
-                elif name_token2 == "STT":
+                else:
                     exact_input_params = {
                         "tokenIn": token_in, 
                         "tokenOut": token_out,
@@ -179,19 +219,13 @@ class QuickSwapModule(Wallet, AsyncLogger):
                         )]
                     )
                     
-                    unwrap_calldata = contract_router.encode_abi(
-                        'unwrapWNativeToken',
-                        args=[amount_out_min, self.wallet_address]
-                    )
+                    unwrap_calldata = f"0x{_UNWRAP_SELECTOR}{amount_out_min:064x}{self._recipient_word}"
 
                     multicall_args = [exact_input_calldata, unwrap_calldata]
 
                     tx_params = await self.build_transaction_params(
                         contract_function=contract_router.functions.multicall(multicall_args)
                     )
-                else:
-                    error_msg =f"For the pair {name_token1} - {name_token2} there is not enough liquidity in the pools, choose another pair"
-                    return False, error_msg
                     
                 await self.logger_msg(
                     f"Sending a transaction swap {name_token1} - {name_token2} on QuickSwap", "info", self.wallet_address
@@ -207,10 +241,10 @@ class QuickSwapModule(Wallet, AsyncLogger):
                 error_msg = f"Error swap {name_token1} - {name_token2} on QuickSwap: {str(e)}"
                 await self.logger_msg(error_msg, "error", self.wallet_address, "swap")
                 
-                if attempt == MAX_RETRY_ATTEMPTS - 1:
+                if attempt == MAX_RETRY_ATTEMPTS - 1 or not is_retryable(e):
                     return False, error_msg
                 
-                await random_sleep(self.wallet_address, *RETRY_SLEEP_RANGE)
+                await backoff_sleep(self.wallet_address, attempt)
                 
         return False, f"Failed swap {name_token1} - {name_token2} on QuickSwap after {MAX_RETRY_ATTEMPTS} attempts"
         
@@ -223,6 +257,20 @@ class QuickSwapModule(Wallet, AsyncLogger):
         
         failed_swaps = []
         success_count = 0
+        deadline = int(time.time()) + 12 * 3600
+        
+        token_addresses = {
+            address for name_token1, _, _ in pair_swap.values()
+            if (address := TOKENS_DATA_SOMNIA.get(name_token1))
+        }
+        prefetched_balances = dict(zip(
+            token_addresses,
+            await asyncio.gather(
+                *(self.token_balance(address) for address in token_addresses),
+                return_exceptions=True
+            )
+        ))
+        swapped_tokens = set()
         
         for key, (name_token1, name_token2, percentage) in pair_swap.items():
             try:
@@ -237,7 +285,11 @@ class QuickSwapModule(Wallet, AsyncLogger):
                     failed_swaps.append(error)
                     continue
                 
-                balance = await self.token_balance(token1_data)
+                if name_token1 in swapped_tokens:
+                    balance = await self.token_balance(token1_data)
+                elif isinstance(balance := prefetched_balances[token1_data], Exception):
+                    raise balance
+                
                 if balance <= 0:
                     error = f"Insufficient {name_token1} balance for pair #{key}"
                     await self.logger_msg(error, "error", self.wallet_address)
@@ -246,7 +298,8 @@ class QuickSwapModule(Wallet, AsyncLogger):
                     
                 amount_in = int(balance * (percentage / 100))
                 
-                success, result_msg = await self.swap(name_token1, name_token2, amount_in)
+                success, result_msg = await self.swap(name_token1, name_token2, amount_in, deadline)
+                swapped_tokens.update((name_token1, name_token2, "STT"))
                 
                 if not success: 
                     await self.logger_msg(f"Swap failed: {result_msg}", "error", self.wallet_address)
@@ -304,8 +357,8 @@ class QuickSwapModule(Wallet, AsyncLogger):
     async def get_token_data(self, symbol_token_a: str = "STT", symbol_token_b: str = "USDC") -> dict:
         await self.logger_msg(f"Get tokens data", "info", self.wallet_address)
         try:
-            token_address_a = self._get_checksum_address(TOKENS_DATA_SOMNIA.get(symbol_token_a))
-            token_address_b = self._get_checksum_address(TOKENS_DATA_SOMNIA.get(symbol_token_b))
+            token_address_a = TOKENS_CHECKSUM_SOMNIA[symbol_token_a]
+            token_address_b = TOKENS_CHECKSUM_SOMNIA[symbol_token_b]
             
             decimals_token_a, decimals_token_b = await asyncio.gather(
                 self.get_decimals(token_address_a),
@@ -315,12 +368,14 @@ class QuickSwapModule(Wallet, AsyncLogger):
                 "token_a": {
                     "symbol": "STT",
                     "address": token_address_a,
-                    "decimals": decimals_token_a
+                    "decimals": int(decimals_token_a),
+                    "scale": 10 ** int(decimals_token_a)
                 },
                 "token_b": {
                     "symbol": "USDC",
                     "address": token_address_b,
-                    "decimals": decimals_token_b
+                    "decimals": int(decimals_token_b),
+                    "scale": 10 ** int(decimals_token_b)
                 }
             }
         except Exception as e:
@@ -341,13 +396,19 @@ class QuickSwapModule(Wallet, AsyncLogger):
             price_stt = 0.115
             price_usdc = 1
             
-            balances = await asyncio.gather(
-                self.token_balance(token_a_data.get('address')),
-                self.token_balance(token_b_data.get('address'))
-            ) 
-            converted = await asyncio.gather(
-                self.convert_amount_from_decimals(balances[0], token_a_data.get('address')),
-                self.convert_amount_from_decimals(balances[1], token_b_data.get('address'))
+            if (multicall := await get_multicall(self)) is None:
+                balances = await asyncio.gather(
+                    self.token_balance(token_a_data.get('address')),
+                    self.token_balance(token_b_data.get('address'))
+                )
+            else:
+                balances = await batch_call(multicall, [
+                    await self._balance_call(multicall, token_a_data.get('address')),
+                    await self._balance_call(multicall, token_b_data.get('address'))
+                ])
+            converted = (
+                balances[0] / token_a_data['scale'],
+                balances[1] / token_b_data['scale']
             )
 
             usd_values = (converted[0] * price_stt, converted[1] * price_usdc)
@@ -369,18 +430,18 @@ class QuickSwapModule(Wallet, AsyncLogger):
             await self.logger_msg(error_msg, "error", self.wallet_address, "get_input_amount")
             return False, error_msg, ""
         
-    async def calculate_token_pair(self, token_a_data, token_b_data, input_amount, input_token, pool_contract):
+    async def calculate_token_pair(self, token_a_data, token_b_data, input_amount, input_token, slot0):
         await self.logger_msg(f"Calculate amount", "info", self.wallet_address)
         try:
-            slot0 = await pool_contract.functions.safelyGetStateOfAMM().call()
             sqrt_price_x96 = slot0[0]
             
-            price = (sqrt_price_x96 / (2**96)) ** 2
-            price_adjusted = price * (10**int(token_a_data.get('decimals')) / 10**int(token_b_data.get('decimals')))
+            price = Fraction(sqrt_price_x96 * sqrt_price_x96, 1 << 192)
+            price = price * Fraction(token_a_data["scale"], token_b_data["scale"])
             
             is_sorted = token_a_data["address"].lower() < token_b_data["address"].lower()
             if not is_sorted:
-                price_adjusted = 1 / price_adjusted
+                price = 1 / price
+            price_adjusted = float(price)
             
             is_token_a_input = token_a_data['symbol'] == input_token
             
@@ -401,15 +462,12 @@ class QuickSwapModule(Wallet, AsyncLogger):
     
     async def calculate_ticks(
         self,
-        pool_contract,
+        slot0,
+        tick_spacing: int,
         price_range_percent: float = LOWER_TOKEN_PERCENTAGE_QUICK_POOL
     ) -> tuple[bool, dict[str, Any]] | tuple[bool, str]:
         await self.logger_msg(f"Calculate ticks", "info", self.wallet_address)
         try:
-            slot0 = await pool_contract.functions.safelyGetStateOfAMM().call()
-            tick_spacing = await pool_contract.functions.tickSpacing().call()
-            current_tick = slot0[1]
-
             current_tick = slot0[1]
             if price_range_percent <= 0:
                 raise ValueError(f"Invalid price range percentage: {price_range_percent}")
@@ -445,88 +503,84 @@ class QuickSwapModule(Wallet, AsyncLogger):
         status, msg = await self.check_config_quick_pool(lower_token_persentage, range_ticks)
         if not status: return status, msg
         
+        tokens_data = await self.get_token_data()
+        if 'error' in tokens_data:
+            return False, tokens_data['error']
+        token_a_data = tokens_data["token_a"]
+        token_b_data = tokens_data["token_b"]
+        
+        deadline = int(time.time()) + 1800
+        
         for attempt in range(MAX_RETRY_ATTEMPTS):
             try:
                 contract = await self.get_contract(QuickPoolContract())
                 contract_factory = await self.get_contract(QuickSwapFactoryContract())
-
-                tokens_data = await self.get_token_data()
-            
-                if 'error' in tokens_data:
-                    return False, tokens_data['error']
-                token_a_data = tokens_data["token_a"]
-                token_b_data = tokens_data["token_b"]
-
+                
+                pair_address = await self._pair_address(contract_factory, TOKENS_CHECKSUM_SOMNIA["WSTT"], token_b_data["address"])
+                pool_contract = await self.get_contract(QuickSwapAddressPairContract(self._get_checksum_address(pair_address)))
+                
                 status, input_amount, low_token_name = await self.get_input_amount(token_a_data, token_b_data)
                 if not status: return False, input_amount
                 
-                pair_address = await contract_factory.functions.poolByPair(self._get_checksum_address(TOKENS_DATA_SOMNIA.get("WSTT")), token_b_data["address"]).call()
-                pool_contract = await self.get_contract(QuickSwapAddressPairContract(self._get_checksum_address(pair_address)))
+                slot0, tick_spacing = await batch_call(await get_multicall(self), [
+                    pool_contract.functions.safelyGetStateOfAMM(),
+                    pool_contract.functions.tickSpacing()
+                ])
                 
-                pair_data = await self.calculate_token_pair(token_a_data, token_b_data, input_amount, low_token_name, pool_contract)
+                pair_data = await self.calculate_token_pair(token_a_data, token_b_data, input_amount, low_token_name, slot0)
                 if 'error' in pair_data:
                     return False, pair_data['error']
                 amount_a = pair_data['amount_a']
                 amount_b = pair_data['amount_b']
 
-                amount_a_wei = int(amount_a * (10 ** int(token_a_data['decimals'])))
-                amount_b_wei = int(amount_b * (10 ** int(token_b_data['decimals'])))
+                amount_a_wei = int(amount_a * token_a_data["scale"])
+                amount_b_wei = int(amount_b * token_b_data["scale"])
 
-                status, ticks_data = await self.calculate_ticks(pool_contract)
+                status, ticks_data = await self.calculate_ticks(slot0, tick_spacing)
                 if not status: return False, ticks_data
 
                 amount_a_min = int(amount_a_wei * (1 - self.slippage / 100))
                 amount_b_min = int(amount_b_wei * (1 - self.slippage / 100))
 
-                is_token_a_lower = token_a_data["address"].lower() < token_b_data["address"].lower()
+                token_a_lc = token_a_data["address"].lower()
+                token_b_lc = token_b_data["address"].lower()
+                native_token_lc = TOKENS_DATA_SOMNIA["STT"].lower()
+
+                is_token_a_lower = token_a_lc < token_b_lc
                 token0_address = token_a_data["address"] if is_token_a_lower else token_b_data["address"]
                 token1_address = token_b_data["address"] if is_token_a_lower else token_a_data["address"]
+                token0_lc, token1_lc = (token_a_lc, token_b_lc) if is_token_a_lower else (token_b_lc, token_a_lc)
                 amount0 = amount_a_wei if is_token_a_lower else amount_b_wei
                 amount1 = amount_b_wei if is_token_a_lower else amount_a_wei
                 amount0_min = amount_a_min if is_token_a_lower else amount_b_min
                 amount1_min = amount_b_min if is_token_a_lower else amount_a_min
 
-                native_token_address = TOKENS_DATA_SOMNIA["STT"].lower()
                 npm_address = self._get_checksum_address(QuickPoolContract().address)
-                for token_address, amount in [(token0_address, amount0), (token1_address, amount1)]:
-                    if token_address.lower() != native_token_address and amount > 0:
+                for token_address, token_lc, amount in [(token0_address, token0_lc, amount0), (token1_address, token1_lc, amount1)]:
+                    if token_lc != native_token_lc and amount > 0:
                         status, result = await self._check_and_approve_token(token_address, npm_address, amount)
                         if not status:
                             return False, result
                         await self.logger_msg(f"Approval for {token_address}: {result}", "info", self.wallet_address)
 
-                mint_params = {
-                    "token0": self._get_checksum_address("0x4a3bc48c156384f9564fd65a53a2f3d534d8f2b7"),
-                    "token1": token1_address,
-                    "deployer": "0x0000000000000000000000000000000000000000",
-                    "tickLower": ticks_data['tick_lower'],
-                    "tickUpper": ticks_data['tick_upper'],
-                    "amount0Desired": amount0,
-                    "amount1Desired": amount1,
-                    "amount0Min": amount0_min,
-                    "amount1Min": amount1_min,
-                    "recipient": self.wallet_address,
-                    "deadline": int(time.time()) + 1800
-                }
-                
                 mint_args = (
-                    mint_params['token0'],
-                    mint_params['token1'],
-                    mint_params['deployer'],
-                    mint_params['tickLower'],
-                    mint_params['tickUpper'],
-                    mint_params['amount0Desired'],
-                    mint_params['amount1Desired'],
-                    mint_params['amount0Min'],
-                    mint_params['amount1Min'],
-                    mint_params['recipient'],
-                    mint_params['deadline']
+                    self._get_checksum_address("0x4a3bc48c156384f9564fd65a53a2f3d534d8f2b7"),  # token0
+                    token1_address,                                                            # token1
+                    "0x0000000000000000000000000000000000000000",                              # deployer
+                    ticks_data['tick_lower'],                                                  # tickLower
+                    ticks_data['tick_upper'],                                                  # tickUpper
+                    amount0,                                                                   # amount0Desired
+                    amount1,                                                                   # amount1Desired
+                    amount0_min,                                                               # amount0Min
+                    amount1_min,                                                               # amount1Min
+                    self.wallet_address,                                                       # recipient
+                    deadline                                                                   # deadline
                 )
                 mint_data = contract.encode_abi('mint', args=[mint_args])
-                refund_data = "0x41865270" 
+                refund_data = _REFUND_NATIVE_TOKEN_CALLDATA
 
-                value = amount0 if token0_address.lower() == native_token_address else (
-                    amount1 if token1_address.lower() == native_token_address else 0
+                value = amount0 if token0_lc == native_token_lc else (
+                    amount1 if token1_lc == native_token_lc else 0
                 )
 
                 tx_params = await self.build_transaction_params(
@@ -550,8 +604,8 @@ class QuickSwapModule(Wallet, AsyncLogger):
             except Exception as e:
                 error_msg = f"Error Add liquidity: {str(e)}"
                 await self.logger_msg(error_msg, "error", self.wallet_address)
-                if attempt == MAX_RETRY_ATTEMPTS - 1:
+                if attempt == MAX_RETRY_ATTEMPTS - 1 or not is_retryable(e):
                     return False, error_msg
-                await random_sleep(self.wallet_address, *RETRY_SLEEP_RANGE)
+                await backoff_sleep(self.wallet_address, attempt)
 
         return False, f"Error Add liquidity: {token_a_data['symbol']} - {token_b_data['symbol']} after {MAX_RETRY_ATTEMPTS} attempts"
\ No newline at end of file
@@ -1,46 +1,78 @@
+import asyncio
+import random
 import time
 
-from faker import Faker
-from typing import Self
+from typing import Final, Self
 from src.logger import AsyncLogger
 from src.api import BaseAPIClient
 from src.wallet import Wallet
 from src.models import Account
-from src.utils import random_sleep
-from config.settings import MAX_RETRY_ATTEMPTS, RETRY_SLEEP_RANGE
+from src.utils import RetryError, retry_async
+from bot_loader import config
+from config.settings import MAX_RETRY_ATTEMPTS
 
 
-def _get_headers() -> dict[str, str]:
-    return {
-        'authority': 'quills.fun',
-        'accept': '*/*',
-        'cache-control': 'no-cache',
-        'content-type': 'application/json',
-        'dnt': '1',
-        'origin': 'https://quills.fun',
-        'pragma': 'no-cache',
-        'referer': 'https://quills.fun/',
-        'sec-fetch-dest': 'empty',
-        'sec-fetch-mode': 'cors',
-        'sec-fetch-site': 'same-origin'
-    }
+_HEADERS: Final[dict[str, str]] = {
+    'authority': 'quills.fun',
+    'accept': '*/*',
+    'cache-control': 'no-cache',
+    'content-type': 'application/json',
+    'dnt': '1',
+    'origin': 'https://quills.fun',
+    'pragma': 'no-cache',
+    'referer': 'https://quills.fun/',
+    'sec-fetch-dest': 'empty',
+    'sec-fetch-mode': 'cors',
+    'sec-fetch-site': 'same-origin'
+}
+_AUTH_PREFIX: Final[str] = "I accept the Quills Adventure Terms of Service at https://quills.fun/terms\n\nNonce: "
+_WORDS: Final[tuple[str, ...]] = (
+    "able", "about", "above", "across", "action", "after", "again", "against",
+    "agent", "almost", "already", "also", "always", "among", "amount", "animal",
+    "answer", "anyone", "appear", "apply", "area", "argue", "around", "arrive",
+    "article", "artist", "attack", "author", "avoid", "back", "badge", "basket",
+    "beach", "bear", "beauty", "become", "before", "begin", "behind", "believe",
+    "better", "beyond", "board", "body", "book", "border", "bridge", "bright",
+    "bring", "brother", "budget", "build", "business", "camera", "campaign",
+    "candle", "carry", "case", "catch", "cause", "center", "chair",
+    "chance", "change", "charge", "choice", "church", "citizen", "city", "claim",
+    "class", "clear", "close", "coach", "cold", "collection", "color", "common",
+    "community", "company", "concern", "control", "cookie", "country", "course",
+    "cover", "create", "cultural", "culture", "current", "dance", "dark",
+    "daughter", "decade", "decide", "deep", "defense", "degree", "design",
+    "detail", "develop", "dinner", "direction", "discover", "doctor", "dream",
+    "drive", "early", "east", "economy", "edge", "effort", "eight", "energy",
+    "enjoy", "enough", "entire", "evening", "event", "example", "expert", "eye",
+    "face", "factor", "family", "field", "figure", "final", "finger", "floor",
+    "flower", "focus", "forest", "forget", "forward", "friend", "future", "garden",
+    "general", "glass", "green", "ground", "group", "growth", "guess", "happy",
+    "harbor", "health", "heart", "heavy", "history", "honey", "hotel", "house",
+    "human", "idea", "image", "impact", "island", "issue", "jacket", "journey",
+    "kitchen", "knowledge", "language", "laugh", "leader", "letter", "light",
+    "listen", "machine", "magic", "market", "matter", "memory", "method", "middle",
+    "minute", "moment", "morning", "mountain", "music", "nation", "nature",
+    "network", "night", "north", "number", "ocean", "office", "orange", "paper",
+    "party", "pattern", "peace", "people", "picture", "planet", "player", "pocket",
+    "policy", "power", "present", "pretty", "problem", "process", "purple",
+    "quality", "question", "quickly", "radio", "reason", "record", "region",
+    "remember", "report", "river", "rocket", "science", "season", "second",
+    "shadow", "silver", "simple", "sister", "society", "soldier", "sound", "south",
+    "space", "spring", "square", "station", "stone", "story", "street", "strong",
+    "student", "summer", "sunset", "system", "table", "teacher", "theory",
+    "thought", "thunder", "ticket", "travel", "tree", "truth", "value", "village",
+    "visit", "voice", "water", "weather", "window", "winter", "wonder", "world",
+    "writer", "yellow", "young",
+)
     
 
 class QuillsMessageModule(Wallet, AsyncLogger):
     def __init__(self, account: Account):
-        Wallet.__init__(self, account.private_key, account.proxy)
+        Wallet.__init__(self, account.private_key, config.somnia_rpc, account.proxy)
         AsyncLogger.__init__(self)        
         self._api = BaseAPIClient(base_url="https://quills.fun/api", proxy=account.proxy)
-        self.fake = Faker()
+        self._auth_valid = False
+        self._mint_message = random.choice(_WORDS)
     
-    @property
-    def api(self) -> BaseAPIClient:
-        return self._api
-
-    @api.setter
-    def api(self, value: BaseAPIClient) -> None:
-        self._api = value
-        
     async def __aenter__(self) -> Self:
         await Wallet.__aenter__(self)
         self._api = await self._api.__aenter__()
@@ -59,6 +91,9 @@ class QuillsMessageModule(Wallet, AsyncLogger):
             error_msg = f"Empty response during {operation_name}"
             await self.logger_msg(error_msg, "error", self.wallet_address, "_process_api_response")
             return False, error_msg
+        
+        if response.get("status_code") in (401, 403):
+            self._auth_valid = False
             
         if response.get("data", {}).get("success"):
             success_msg = f"Successfully {operation_name}"
@@ -70,107 +105,120 @@ class QuillsMessageModule(Wallet, AsyncLogger):
             await self.logger_msg(error_msg, "error", self.wallet_address, "_process_api_response")
             return False, error_msg
     
+    async def _auth_once(
+        self,
+        attempt: int,
+        error_messages: list[str],
+        warm_up: asyncio.Task | None = None
+    ) -> tuple[bool, str]:
+        await self.logger_msg(f"Authorization attempt {attempt+1}/{MAX_RETRY_ATTEMPTS}", "debug", self.wallet_address)
+        try:
+            message = _AUTH_PREFIX + str(time.time_ns() // 1_000_000)
+            signature = await self.get_signature(message)
+            if warm_up is not None:
+                await warm_up
+            
+            json_data = {
+                'address': self.wallet_address,
+                'signature': f"0x{signature}",
+                'message': message,
+            }
+            
+            response = await self._api.send_request(
+                request_type="POST",
+                method="/auth/wallet",
+                json_data=json_data,
+                headers=_HEADERS,
+                verify=False,
+                ssl=self._api.ssl_context
+            )
+        except Exception as e:
+            error_msg = f"Auth attempt {attempt+1} failed: {str(e)}"
+            await self.logger_msg(error_msg, "error", self.wallet_address, "auth")
+            error_messages.append(error_msg)
+            raise
+        
+        if response is None:
+            error_msg = f"Empty auth response (attempt {attempt+1})"
+            await self.logger_msg(error_msg, "error", self.wallet_address, "auth")
+            error_messages.append(error_msg)
+            raise RetryError(error_msg)
+            
+        status, result = await self._process_api_response(response, "logged into the site quills.fun")
+        if not status:
+            error_messages.append(result)
+            raise RetryError(result)
+        self._auth_valid = True
+        return status, result
+    
     async def auth(self) -> tuple[bool, str]:
         await self.logger_msg("Starting authorization on the quills.fun...", "info", self.wallet_address)
         error_messages = []
+        warm_up = asyncio.create_task(self._api.ensure_session_connected())
         
-        for attempt in range(MAX_RETRY_ATTEMPTS):
-            try:
-                await self.logger_msg(f"Authorization attempt {attempt+1}/{MAX_RETRY_ATTEMPTS}", "info", self.wallet_address)
-                
-                message = f"I accept the Quills Adventure Terms of Service at https://quills.fun/terms\n\nNonce: {int(time.time() * 1000)}"
-                signature = await self.get_signature(message)
-                
-                json_data = {
-                    'address': self.wallet_address,
-                    'signature': f"0x{signature}",
-                    'message': message,
-                }
-                
-                response = await self._api.send_request(
-                    request_type="POST",
-                    method="/auth/wallet",
-                    json_data=json_data,
-                    headers=_get_headers(),
-                    verify=False
-                )
-                
-                if response is None:
-                    error_msg = f"Empty auth response (attempt {attempt+1})"
-                    await self.logger_msg(error_msg, "error", self.wallet_address, "auth")
-                    error_messages.append(error_msg)
-                    if attempt < MAX_RETRY_ATTEMPTS-1:
-                        await random_sleep(self.wallet_address, *RETRY_SLEEP_RANGE)
-                    continue
-                    
-                status, result = await self._process_api_response(response, "logged into the site quills.fun")
-                if status:
-                    return status, result
-                    
-                error_messages.append(result)
-                if attempt < MAX_RETRY_ATTEMPTS-1:
-                    await random_sleep(self.wallet_address, *RETRY_SLEEP_RANGE)
-                    
-            except Exception as e:
-                error_msg = f"Auth attempt {attempt+1} failed: {str(e)}"
-                await self.logger_msg(error_msg, "error", self.wallet_address, "auth")
-                error_messages.append(error_msg)
-                if attempt < MAX_RETRY_ATTEMPTS-1:
-                    await random_sleep(self.wallet_address, *RETRY_SLEEP_RANGE)
-        
-        return False, f"Authorization failed after {MAX_RETRY_ATTEMPTS} attempts. Errors:\n" + "\n".join(error_messages)
+        try:
+            return await retry_async(
+                lambda attempt: self._auth_once(attempt, error_messages, warm_up),
+                attempts=MAX_RETRY_ATTEMPTS,
+                address=self.wallet_address
+            )
+        except Exception:
+            return False, f"Authorization failed after {MAX_RETRY_ATTEMPTS} attempts. Errors:\n" + "\n".join(error_messages)
 
     async def mint_message_nft(self) -> tuple[bool, str]:
         await self.logger_msg(f"Starting sending a message...", "info", self.wallet_address)
         error_messages = []
-        message = self.fake.word()
+        message = self._mint_message
         
         json_data = {
             'walletAddress': self.wallet_address,
             'message': message,
         }
         
-        for attempt in range(MAX_RETRY_ATTEMPTS):
+        async def attempt_mint(attempt: int) -> tuple[bool, str]:
+            await self.logger_msg(f"Attempt to mint a message {attempt+1}/{MAX_RETRY_ATTEMPTS}", "debug", self.wallet_address)
+            if not self._auth_valid:
+                await self._auth_once(attempt, error_messages)
             try:
-                await self.logger_msg(f"Attempt to mint a message {attempt+1}/{MAX_RETRY_ATTEMPTS}", "info", self.wallet_address)
-                
                 response = await self._api.send_request(
                     request_type="POST",
                     method="/mint-nft",
                     json_data=json_data,
-                    headers=_get_headers(),
-                    verify=False
+                    headers=_HEADERS,
+                    verify=False,
+                    ssl=self._api.ssl_context
                 )
-                
-                if response.get("status_code") == 500:
-                    error_msg = "Quills server is not working, please try again later"
-                    await self.logger_msg(error_msg, "error", self.wallet_address, "mint_message_nft")
-                    return False, error_msg
-                
-                if response is None:
-                    error_msg = f"Received empty API response (attempt {attempt+1})"
-                    await self.logger_msg(error_msg, "error", self.wallet_address, "mint_message_nft")
-                    error_messages.append(error_msg)
-                    if attempt < MAX_RETRY_ATTEMPTS-1:
-                        await random_sleep(self.wallet_address, *RETRY_SLEEP_RANGE)
-                    continue
-                    
-                status, result = await self._process_api_response(response, f"minted an nft message: {message}")
-                if status:
-                    return status, result
-                
-                error_messages.append(result)
-                if attempt < MAX_RETRY_ATTEMPTS-1:
-                    await random_sleep(self.wallet_address, *RETRY_SLEEP_RANGE)
-                    
             except Exception as e:
                 error_msg = f"Attempt {attempt+1} failed: {str(e)}"
                 await self.logger_msg(error_msg, "error", self.wallet_address, "mint_message_nft")
                 error_messages.append(error_msg)
-                if attempt < MAX_RETRY_ATTEMPTS-1:
-                    await random_sleep(self.wallet_address, *RETRY_SLEEP_RANGE)
+                raise
             
-        return False, f"Failed minting message after {MAX_RETRY_ATTEMPTS} attempts. Error details:\n" + "\n".join(error_messages)
+            if response is None:
+                error_msg = f"Received empty API response (attempt {attempt+1})"
+                await self.logger_msg(error_msg, "error", self.wallet_address, "mint_message_nft")
+                error_messages.append(error_msg)
+                raise RetryError(error_msg)
+            
+            if response.get("status_code") == 500:
+                error_msg = "Quills server is not working, please try again later"
+                await self.logger_msg(error_msg, "error", self.wallet_address, "mint_message_nft")
+                return False, error_msg
+                
+            status, result = await self._process_api_response(response, f"minted an nft message: {message}")
+            if not status:
+                error_messages.append(result)
+                raise RetryError(result)
+            return status, result
+        
+        try:
+            return await retry_async(
+                attempt_mint,
+                attempts=MAX_RETRY_ATTEMPTS,
+                address=self.wallet_address
+            )
+        except Exception:
+            return False, f"Failed minting message after {MAX_RETRY_ATTEMPTS} attempts. Error details:\n" + "\n".join(error_messages)
     
     async def run(self) -> tuple[bool, str]:
         try:
@@ -1,20 +1,40 @@
 from faker import Faker
-import re
-from typing import Self
+from typing import ClassVar, Self
 
 from src.models import Account, SomniaDomainsContract
 from src.wallet import Wallet
 from bot_loader import config
 from src.logger import AsyncLogger
-from src.utils import show_trx_log, random_sleep
-from config.settings import MAX_RETRY_ATTEMPTS, RETRY_SLEEP_RANGE
+from src.utils import show_trx_log, RetryError, retry_async
+from config.settings import MAX_RETRY_ATTEMPTS
+
+
+_ERROR_SELECTOR = "08c379a0"
+_ALREADY_CLAIMED_MSG = b"Already claimed a name"
+
+
+def _revert_reason(error: BaseException) -> bytes | None:
+    """Extracts the Error(string) payload from revert data or the error text"""
+    data = getattr(error, "data", None)
+    text = data if isinstance(data, str) else str(error)
+    start = text.find(_ERROR_SELECTOR)
+    if start == -1:
+        return None
+    # selector | 32-byte offset | 32-byte length | reason
+    length_at = start + len(_ERROR_SELECTOR) + 64
+    try:
+        length = int(text[length_at:length_at + 64], 16)
+        return bytes.fromhex(text[length_at + 64:length_at + 64 + length * 2])
+    except ValueError:
+        return None
 
 
 class SomniaDomainsModule(Wallet, AsyncLogger):
+    _FAKER: ClassVar[Faker] = Faker()
+
     def __init__(self, account: Account) -> None:
         Wallet.__init__(self, account.private_key, config.somnia_rpc, account.proxy)
         AsyncLogger.__init__(self)
-        self.faker = Faker()
 
     async def __aenter__(self) -> Self:
         await Wallet.__aenter__(self)
@@ -24,17 +44,15 @@ class SomniaDomainsModule(Wallet, AsyncLogger):
         await Wallet.__aexit__(self, exc_type, exc_val, exc_tb)
 
     def generate_domain_name(self) -> str:
-        domain_name = self.faker.domain_name()
-        return re.split(r'\.', domain_name)[0]
+        return self._FAKER.domain_name().partition('.')[0]
 
     async def run(self) -> tuple[bool, str]:
         await self.logger_msg("Starting mint Somnia Domain...", "info", self.wallet_address)
         error_messages = []
         
-        for attempt in range(MAX_RETRY_ATTEMPTS):
+        async def attempt_mint(attempt: int) -> tuple[bool, str]:
+            await self.logger_msg(f"Mint attempt {attempt+1}/{MAX_RETRY_ATTEMPTS}", "info", self.wallet_address)
             try:
-                await self.logger_msg(f"Mint attempt {attempt+1}/{MAX_RETRY_ATTEMPTS}", "info", self.wallet_address)
-                
                 balance = await self.human_balance()
                 if balance < 1:
                     error_msg = f"Not enough balance for mint. Current: {balance} STT, Required: 1 STT"
@@ -52,12 +70,9 @@ class SomniaDomainsModule(Wallet, AsyncLogger):
                 status, tx_hash = await self._process_transaction(tx_params)
                 
                 await show_trx_log(self.wallet_address, f"Somnia Domain {domain}", status, tx_hash)
-                
-                if status:
-                    return status, tx_hash
             except Exception as e:
                 error_str = str(e)
-                if "0x08c379a000000000000000000000000000000000000000000000000000000000000000200000000000000000000000000000000000000000000000000000000000000016416c726561647920636c61696d65642061206e616d6500000000000000000000" in error_str:
+                if _revert_reason(e) == _ALREADY_CLAIMED_MSG:
                     success_msg = "Domain already minted for this account"
                     await self.logger_msg(success_msg, "success", self.wallet_address)
                     return True, success_msg
@@ -65,8 +80,17 @@ class SomniaDomainsModule(Wallet, AsyncLogger):
                 error_msg = f"Attempt {attempt+1} error: {error_str}"
                 error_messages.append(error_msg)
                 await self.logger_msg(error_msg, "error", self.wallet_address, "run")
+                raise
+            
+            if not status:
+                raise RetryError(f"Transaction failed: {tx_hash}")
+            return status, tx_hash
 
-            if attempt < MAX_RETRY_ATTEMPTS - 1:
-                await random_sleep(self.wallet_address, *RETRY_SLEEP_RANGE)
-
-        return False, f"Failed after {MAX_RETRY_ATTEMPTS} attempts. Errors:\n" + "\n".join(error_messages)
\ No newline at end of file
+        try:
+            return await retry_async(
+                attempt_mint,
+                attempts=MAX_RETRY_ATTEMPTS,
+                address=self.wallet_address
+            )
+        except Exception:
+            return False, f"Failed after {MAX_RETRY_ATTEMPTS} attempts. Errors:\n" + "\n".join(error_messages)
@@ -4,5 +4,10 @@ from .utils import *
 from .logger_trx import *
 from .excel_processor import *
 from .send_tg_message import *
+from .multicall import *
+from .retry import *
+from .amm_math import *
+from .pool_cache import PoolCache, pool_cache
+from .twitter_task_cache import TwitterTaskCache, twitter_task_cache
 from .twitter_worker import TwitterWorker
 from .deploy_contracts import DeployContractWorker
\ No newline at end of file
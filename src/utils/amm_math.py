@@ -0,0 +1,17 @@
+Q192_SHIFT = 192
+FEE_DENOMINATOR = 1_000_000
+
+
+def compute_amount_out(
+    sqrt_price_x96: int,
+    last_fee: int,
+    amount_in: int,
+    zero_to_one: bool
+) -> int:
+    """Expected output of a single-pool swap in Q64.96 integer math, after the pool fee"""
+    price_x192 = sqrt_price_x96 * sqrt_price_x96
+    if zero_to_one:
+        amount_out = (amount_in * price_x192) >> Q192_SHIFT
+    else:
+        amount_out = (amount_in << Q192_SHIFT) // price_x192
+    return amount_out * (FEE_DENOMINATOR - last_fee) // FEE_DENOMINATOR
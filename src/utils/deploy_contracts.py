@@ -1,35 +1,36 @@
+import asyncio
 import re
 import random
+import string
 from faker import Faker
 
-from typing import Self
+from typing import Any, ClassVar, Self
 
 from src.logger import AsyncLogger
 from src.models import Account, ERC20Contract
 from src.wallet import Wallet
 
 
+_FAKER = Faker()
+_NON_ALPHA = re.compile(r'[^a-zA-Z]')
 
-class ContractGeneratorData:
-    def __init__(self):
-        self.fake = Faker()
 
+class ContractGeneratorData:
     def generate_contract_name(self) -> str:
-        word = self.fake.word()
+        word = _FAKER.word()
         contract_name = ''.join(x.capitalize() for x in word.split())
-        contract_name = re.sub(r'[^a-zA-Z]', '', contract_name)
+        contract_name = _NON_ALPHA.sub('', contract_name)
         return contract_name
 
     def generate_token_details(self) -> dict:
         return {
-            'token_name': f"{self.fake.company()}",
+            'token_name': f"{_FAKER.company()}",
             'token_symbol': self.generate_token_symbol(),
             'total_supply': self.generate_total_supply()
         }
 
     def generate_token_symbol(self, max_length: int = 5) -> str:
-        symbol = ''.join(self.fake.random_uppercase_letter() for _ in range(min(max_length, 5)))
-        return symbol
+        return ''.join(random.choices(string.ascii_uppercase, k=min(max_length, 5)))
 
     def generate_total_supply(self) -> int:
         round_multipliers = [1000, 10_000, 100_000, 1_000_000]
@@ -41,6 +42,9 @@ class ContractGeneratorData:
     
     
 class DeployContractWorker(Wallet, AsyncLogger):
+    _artifacts: ClassVar[tuple[list[dict[str, Any]], str] | None] = None
+    _artifacts_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
+    
     def __init__(self, account: Account) -> None:
         from bot_loader import config
         Wallet.__init__(self, account.private_key, rpc_url=config.somnia_rpc, proxy=account.proxy)
@@ -53,6 +57,30 @@ class DeployContractWorker(Wallet, AsyncLogger):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await Wallet.__aexit__(self, exc_type, exc_val, exc_tb)
+
+    async def _get_artifacts(self) -> tuple[list[dict[str, Any]], str]:
+        cls = type(self)
+        if cls._artifacts is None:
+            async with cls._artifacts_lock:
+                if cls._artifacts is None:
+                    cls._artifacts = (
+                        await self.erc20_contract.get_abi(),
+                        await self.erc20_contract.get_bytecode()
+                    )
+        return cls._artifacts
+
+    async def _get_nonce_and_gas_price(self) -> tuple[int, int]:
+        if self._nonce is not None:
+            return self._nonce, await self.eth.gas_price
+        try:
+            async with self.batch_requests() as batch:
+                batch.add(self.eth.get_transaction_count(self.wallet_address, 'pending'))
+                batch.add(self.eth.gas_price)
+                nonce, gas_price = await batch.async_execute()
+            return nonce, gas_price
+        except Exception:
+            # Some RPCs reject JSON-RPC batches
+            return await asyncio.gather(self.get_nonce(), self.eth.gas_price)
         
     async def deploy_erc_20_contract(self) -> tuple[bool, str]:        
         generator = ContractGeneratorData()
@@ -68,14 +96,15 @@ class DeployContractWorker(Wallet, AsyncLogger):
             type_msg="info", address=self.wallet_address
         )
         
-        abi = await self.erc20_contract.get_abi()
-        bytecode = await self.erc20_contract.get_bytecode()
+        (abi, bytecode), (nonce, gas_price) = await asyncio.gather(
+            self._get_artifacts(), self._get_nonce_and_gas_price()
+        )
         contract = self.eth.contract(abi=abi, bytecode=bytecode)
 
         deploy_tx = await contract.constructor(name, symbol, initial_supply_wei).build_transaction({
             'from': self.wallet_address,
-            'nonce': await self.get_nonce(),
-            'gasPrice': await self.eth.gas_price,
+            'nonce': nonce,
+            'gasPrice': gas_price,
         })
 
         gas_estimate = await self.eth.estimate_gas(deploy_tx)
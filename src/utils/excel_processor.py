@@ -1,8 +1,10 @@
 import os
+import re
+import atexit
 import asyncio
-import aiofiles
+from collections import defaultdict
 import openpyxl
-from typing import Union
+from typing import Any, TextIO, Union
 
 from src.logger import AsyncLogger
 
@@ -23,102 +25,250 @@ COL_RECONNECT_TWITTER = 'Reconnect Twitter'
 COL_NATIVE_BALANCE = 'Native Balance $STT'
 COL_ADDRESS = 'Address'
 
-# File lock for safe file operations
-file_lock = asyncio.Lock()
+# Bad values are cleared from accounts.xlsx in batches
+INVALIDATION_BATCH_SIZE = 100
+INVALIDATION_FLUSH_INTERVAL = 60.0
+
+# One lock per file so unrelated files are written in parallel
+file_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 logger = AsyncLogger()
 
+_invalidation_queue: asyncio.Queue[tuple[str, str, str | None, str | None]] = asyncio.Queue()
+_invalidation_task: asyncio.Task | None = None
+_flush_requested = asyncio.Event()
+_pending_flushes = 0
+_column_maps: dict[str, tuple[float, dict[str, int]]] = {}
+_accounts_workbook: tuple[float, Any] | None = None
+_account_rows: tuple[float, list[tuple]] | None = None
+_account_row_indexes: dict[int, dict[str, list[int]]] = {}
+_bad_token_handles: dict[str, TextIO] = {}
+_bad_tokens: dict[str, set[str]] = {}
+_AUTH_STATUS_RE = re.compile(r"40[13]")
+_AUTH_TERM_RE = re.compile(r"auth|token|login|credentials", re.IGNORECASE)
+
 
-async def is_string_in_file(file_path: str, search_string: str) -> bool:
-    """hecks if the string is in the file"""
+def _read_lines(file_path: str) -> set[str]:
     if not os.path.exists(file_path):
-        return False
-    async with aiofiles.open(file_path, 'r') as file:
-        content = await file.read()
-        return search_string in content.splitlines()
+        return set()
+    with open(file_path, 'r') as file:
+        return {line.rstrip('\n') for line in file}
+
+
+async def _get_bad_tokens(file_path: str) -> set[str]:
+    """Loads a bad-token file once and keeps its lines in memory"""
+    tokens = _bad_tokens.get(file_path)
+    if tokens is None:
+        tokens = _bad_tokens[file_path] = await asyncio.to_thread(_read_lines, file_path)
+    return tokens
 
 
 def get_excel_column_mapping(worksheet) -> dict[str, int]:
     """Creates a mapping of column headers to their indices"""
-    header_row = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=False))
+    header_row = next(worksheet.iter_rows(min_row=1, max_row=1, values_only=True))
     col_map = {}
-    for idx, cell in enumerate(header_row):
-        if cell.value:
-            col_map[cell.value.strip()] = idx
+    for idx, value in enumerate(header_row):
+        if value:
+            col_map[value.strip()] = idx
     return col_map
 
 
+def _load_column_mapping(file_path: str) -> dict[str, int]:
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        return get_excel_column_mapping(wb.active)
+    finally:
+        wb.close()
+
+
+async def get_cached_column_mapping(file_path: str) -> dict[str, int]:
+    """Reads the header row in read-only mode until the file changes"""
+    mtime = os.path.getmtime(file_path)
+    cached = _column_maps.get(file_path)
+    if cached is None or cached[0] != mtime:
+        cached = _column_maps[file_path] = (mtime, await asyncio.to_thread(_load_column_mapping, file_path))
+    return cached[1]
+
+
+def _get_bad_token_handle(file_path: str) -> TextIO:
+    """Opens a bad-token file for appending once and keeps it line buffered"""
+    handle = _bad_token_handles.get(file_path)
+    if handle is None:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        handle = _bad_token_handles[file_path] = open(file_path, 'a', buffering=1)
+    return handle
+
+
+@atexit.register
+def _close_bad_token_handles() -> None:
+    for handle in _bad_token_handles.values():
+        handle.close()
+    _bad_token_handles.clear()
+
+
+def _load_account_rows() -> list[tuple]:
+    wb = openpyxl.load_workbook(ACCOUNTS_PATH, read_only=True, data_only=True)
+    try:
+        return list(wb.active.iter_rows(min_row=2, values_only=True))
+    finally:
+        wb.close()
+
+
+async def _read_account_rows() -> list[tuple]:
+    """Reads the data rows of accounts.xlsx in read-only mode until the file changes"""
+    global _account_rows
+    mtime = os.path.getmtime(ACCOUNTS_PATH)
+    if _account_rows is None or _account_rows[0] != mtime:
+        _account_rows = (mtime, await asyncio.to_thread(_load_account_rows))
+        _account_row_indexes.clear()
+    return _account_rows[1]
+
+
+async def _account_row_index(col_idx: int) -> dict[str, list[int]]:
+    """Maps each stripped value of a column to the sheet rows that hold it"""
+    rows = await _read_account_rows()
+    index = _account_row_indexes.get(col_idx)
+    if index is None:
+        index = {}
+        for row_idx, row in enumerate(rows, 2):
+            value = row[col_idx] if col_idx < len(row) else None
+            if value:
+                index.setdefault(str(value).strip(), []).append(row_idx)
+        _account_row_indexes[col_idx] = index
+    return index
+
+
+async def _load_accounts_workbook() -> Any:
+    """Returns the writable accounts.xlsx workbook, reloading it only if the file changed on disk"""
+    global _accounts_workbook
+    mtime = os.path.getmtime(ACCOUNTS_PATH)
+    if _accounts_workbook is None or _accounts_workbook[0] != mtime:
+        wb = await asyncio.to_thread(openpyxl.load_workbook, ACCOUNTS_PATH)
+        _accounts_workbook = (mtime, wb)
+    return _accounts_workbook[1]
+
+
+async def _save_accounts_workbook(wb: Any) -> None:
+    global _accounts_workbook
+    await asyncio.to_thread(wb.save, ACCOUNTS_PATH)
+    _accounts_workbook = (os.path.getmtime(ACCOUNTS_PATH), wb)
+
+
 async def save_to_bad_token_file(file_path: str, token: str) -> None:
     """Saves the token to the file of invalid tokens if it is not already there"""
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    if not await is_string_in_file(file_path, token):
-        async with aiofiles.open(file_path, 'a') as file:
-            await file.write(f"{token}\n")
+    tokens = await _get_bad_tokens(file_path)
+    if token in tokens:
+        return
+    tokens.add(token)
+    _get_bad_token_handle(file_path).write(f"{token}\n")
 
 
-async def update_excel_for_bad_token(
-    token: str, 
-    token_column_name: str, 
-    reconnect_column_name: str,
-    wallet_address: str | None = None
-) -> None:
-    """Updates the Excel file when an invalid token is detected"""
+async def _apply_invalidations(batch: list[tuple[str, str, str | None, str | None]]) -> None:
+    """Clears every queued bad value in one workbook load and save"""
     if not os.path.exists(ACCOUNTS_PATH):
         return
         
     try:
-        wb = openpyxl.load_workbook(ACCOUNTS_PATH)
-        ws = wb.active
+        col_map = await get_cached_column_mapping(ACCOUNTS_PATH)
         
-        col_map = get_excel_column_mapping(ws)
+        targets: dict[int, dict[str, tuple[int | None, str, str | None]]] = {}
+        for token_column_name, token, reconnect_column_name, wallet_address in batch:
+            token_col_idx = col_map.get(token_column_name)
+            if token_col_idx is None:
+                continue
+            reconnect_col_idx = None
+            if reconnect_column_name is not None:
+                reconnect_col_idx = col_map.get(reconnect_column_name)
+                if reconnect_col_idx is None:
+                    continue
+            targets.setdefault(token_col_idx, {})[token] = (reconnect_col_idx, token_column_name, wallet_address)
         
-        token_col_idx = col_map.get(token_column_name)
-        if token_col_idx is None:
+        if not targets:
             return
         
-        reconnect_col_idx = col_map.get(reconnect_column_name)
-        if reconnect_col_idx is None:
-            return
+        index = {token_col_idx: await _account_row_index(token_col_idx) for token_col_idx in targets}
         
-        rows_modified = 0
-        for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=False), 2):
-            cell = row[token_col_idx]
-            cell_value = cell.value
-            
-            if cell_value and str(cell_value).strip() == token:
-                cell.value = ""
-                ws.cell(row=row_idx, column=reconnect_col_idx + 1).value = 1
-                rows_modified += 1
+        updates: dict[int, dict[int, Any]] = {}
+        cleared: dict[tuple[str, str], str | None] = {}
+        for token_col_idx, tokens in targets.items():
+            for token, (reconnect_col_idx, token_column_name, wallet_address) in tokens.items():
+                for row_idx in index[token_col_idx].get(token, ()):
+                    row_updates = updates.setdefault(row_idx, {})
+                    row_updates[token_col_idx] = ""
+                    if reconnect_col_idx is not None:
+                        row_updates[reconnect_col_idx] = 1
+                    cleared[(token_column_name, token)] = wallet_address
         
-        if rows_modified > 0:
-            wb.save(ACCOUNTS_PATH)
+        if cleared:
+            wb = await _load_accounts_workbook()
+            ws = wb.active
+            for row_idx, row_updates in updates.items():
+                for col_idx, value in row_updates.items():
+                    ws.cell(row=row_idx, column=col_idx + 1).value = value
+            await _save_accounts_workbook(wb)
             
-            if wallet_address:
-                log_kwargs["address"] = wallet_address
-                
-            await logger.logger_msg(f"Cleared bad {token_column_name} and set {reconnect_column_name} value 1", "info")
+            for (token_column_name, _), wallet_address in cleared.items():
+                await logger.logger_msg(f"Cleared bad {token_column_name} from accounts.xlsx", "info", wallet_address)
             
     except Exception as e:
-        method_name = f"update_excel_for_bad_token({token_column_name})"
-        log_kwargs = {"type_msg": "error", "method_name": method_name}
-        
-        if wallet_address:
-            log_kwargs["address"] = wallet_address
-            
-        await logger.logger_msg(f"Error updating accounts.xlsx: {str(e)}", **log_kwargs)
+        await logger.logger_msg(f"Error updating accounts.xlsx: {str(e)}", "error", method_name="_apply_invalidations")
+
+
+async def _drain_invalidations() -> None:
+    while True:
+        batch = [await _invalidation_queue.get()]
+        try:
+            try:
+                await asyncio.wait_for(_flush_requested.wait(), INVALIDATION_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+                
+            while not _invalidation_queue.empty():
+                batch.append(_invalidation_queue.get_nowait())
+            async with file_locks[ACCOUNTS_PATH]:
+                await _apply_invalidations(batch)
+        finally:
+            for _ in batch:
+                _invalidation_queue.task_done()
+            # Keep forcing only while a waiting flush or a full batch still has queued rows
+            if _invalidation_queue.empty() or not (
+                _pending_flushes or _invalidation_queue.qsize() >= INVALIDATION_BATCH_SIZE
+            ):
+                _flush_requested.clear()
+
+
+def _queue_invalidation(
+    token_column_name: str,
+    token: str,
+    reconnect_column_name: str | None,
+    wallet_address: str | None
+) -> None:
+    global _invalidation_task
+    if _invalidation_task is None or _invalidation_task.done():
+        _invalidation_task = asyncio.create_task(_drain_invalidations())
+    _invalidation_queue.put_nowait((token_column_name, token, reconnect_column_name, wallet_address))
+    if _invalidation_queue.qsize() >= INVALIDATION_BATCH_SIZE:
+        _flush_requested.set()
+
+
+async def flush_excel_updates() -> None:
+    """Writes every queued accounts.xlsx update now and waits for it"""
+    global _pending_flushes
+    if _invalidation_task is None or _invalidation_task.done():
+        return
+    _pending_flushes += 1
+    try:
+        _flush_requested.set()
+        await _invalidation_queue.join()
+    finally:
+        _pending_flushes -= 1
 
 
 async def save_bad_discord_token(discord_token: str, wallet_address: str) -> None:
     """Handles an invalid Discord token"""
-    async with file_lock:
+    async with file_locks[BAD_DISCORD_TOKEN_PATH]:
         try:
             await save_to_bad_token_file(BAD_DISCORD_TOKEN_PATH, discord_token)
-            
-            await update_excel_for_bad_token(
-                token=discord_token,
-                token_column_name=COL_DISCORD_TOKEN,
-                reconnect_column_name=COL_RECONNECT_DISCORD,
-                wallet_address=wallet_address
-            )
+            _queue_invalidation(COL_DISCORD_TOKEN, discord_token, COL_RECONNECT_DISCORD, wallet_address)
                 
         except Exception as e:
             await logger.logger_msg(f"Error processing Discord token: {str(e)}", "error", wallet_address, "save_bad_discord_token")
@@ -126,16 +276,10 @@ async def save_bad_discord_token(discord_token: str, wallet_address: str) -> Non
 
 async def save_bad_twitter_token(twitter_token: str, wallet_address: str = None) -> None:
     """Handles an invalid Twitter token"""
-    async with file_lock:
+    async with file_locks[BAD_TWITTER_TOKEN_PATH]:
         try:
             await save_to_bad_token_file(BAD_TWITTER_TOKEN_PATH, twitter_token)
-            
-            await update_excel_for_bad_token(
-                token=twitter_token,
-                token_column_name=COL_TWITTER_TOKEN,
-                reconnect_column_name=COL_RECONNECT_TWITTER,
-                wallet_address=wallet_address
-            )
+            _queue_invalidation(COL_TWITTER_TOKEN, twitter_token, COL_RECONNECT_TWITTER, wallet_address)
                 
         except Exception as e:
             await logger.logger_msg(f"Error processing Twitter token: {str(e)}", "error", wallet_address, "save_bad_twitter_token")
@@ -154,13 +298,12 @@ async def check_twitter_error_for_invalid_token(
             await save_bad_twitter_token(twitter_token, wallet_address)
             return True
 
-    error_str = str(error_message).lower()
+    error_str = str(error_message)
     
-    if any(code in error_str for code in ["401", "403", "status: 401", "status: 403"]):
-        if any(auth_term in error_str for auth_term in ["auth", "token", "login", "credentials"]):
-            await logger.logger_msg(f"Detected authentication error in Twitter API", "warning", wallet_address, "check_twitter_error_for_invalid_token")
-            await save_bad_twitter_token(twitter_token, wallet_address)
-            return True
+    if _AUTH_STATUS_RE.search(error_str) and _AUTH_TERM_RE.search(error_str):
+        await logger.logger_msg(f"Detected authentication error in Twitter API", "warning", wallet_address, "check_twitter_error_for_invalid_token")
+        await save_bad_twitter_token(twitter_token, wallet_address)
+        return True
     
     return False
 
@@ -182,9 +325,7 @@ async def clear_reconnect_flag_after_success(
         return
 
     try:
-        wb = openpyxl.load_workbook(ACCOUNTS_PATH)
-        ws = wb.active
-        col_map = get_excel_column_mapping(ws)
+        col_map = await get_cached_column_mapping(ACCOUNTS_PATH)
 
         token_col_idx = col_map.get(token_column_name)
         reconnect_col_idx = col_map.get(reconnect_column_name)
@@ -192,52 +333,33 @@ async def clear_reconnect_flag_after_success(
         if None in (token_col_idx, reconnect_col_idx):
             return
 
-        rows_modified = 0
-        for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=False), 2):
-            token_cell = row[token_col_idx]
-            if token_cell.value and str(token_cell.value).strip() == token:
-                reconnect_cell = ws.cell(row=row_idx, column=reconnect_col_idx + 1)
-                reconnect_cell.value = 0
-                rows_modified += 1
-
-        if rows_modified > 0:
-            wb.save(ACCOUNTS_PATH)
-            await logger.logger_msg(f"Reset {reconnect_column_name} to 0 for valid token", "info", wallet_address)
+        async with file_locks[ACCOUNTS_PATH]:
+            rows = await _read_account_rows()
+            rows_to_reset = [
+                row_idx
+                for row_idx in (await _account_row_index(token_col_idx)).get(token, ())
+                if reconnect_col_idx < len(rows[row_idx - 2])
+                and rows[row_idx - 2][reconnect_col_idx] not in (None, 0, "0")
+            ]
+            
+            if rows_to_reset:
+                wb = await _load_accounts_workbook()
+                ws = wb.active
+                for row_idx in rows_to_reset:
+                    ws.cell(row=row_idx, column=reconnect_col_idx + 1).value = 0
+                await _save_accounts_workbook(wb)
+                await logger.logger_msg(f"Reset {reconnect_column_name} to 0 for valid token", "info", wallet_address)
 
     except Exception as e:
         await logger.logger_msg(f"Error resetting reconnect flag: {str(e)}", "error", wallet_address, "clear_reconnect_flag_after_success")
 
 async def save_bad_private_key(private_key: str, wallet_address: str) -> None:
     """Handles an invalid private key """
-    async with file_lock:
+    async with file_locks[BAD_PRIVATE_KEY_PATH]:
         try:
             await save_to_bad_token_file(BAD_PRIVATE_KEY_PATH, private_key)
+            _queue_invalidation(COL_PRIVATE_KEY, private_key, None, wallet_address)
             
-            if os.path.exists(ACCOUNTS_PATH):
-                try:
-                    wb = openpyxl.load_workbook(ACCOUNTS_PATH)
-                    ws = wb.active
-                    
-                    col_map = get_excel_column_mapping(ws)
-                    pk_col_idx = col_map.get(COL_PRIVATE_KEY)
-                    
-                    if pk_col_idx is not None:
-                        rows_modified = 0
-                        
-                        for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=False), 2):
-                            cell = row[pk_col_idx]
-                            cell_value = cell.value
-                            
-                            if cell_value and str(cell_value).strip() == private_key:
-                                cell.value = ""
-                                rows_modified += 1
-                        
-                        if rows_modified:
-                            wb.save(ACCOUNTS_PATH)
-                            await logger.logger_msg(f"Cleared bad private key from accounts.xlsx", "info", wallet_address)
-                except Exception as e:
-                    await logger.logger_msg(f"Error updating accounts.xlsx: {str(e)}", "error", wallet_address, "save_bad_private_key")
-                    
         except Exception as e:
             await logger.logger_msg(f"Error processing private key: {str(e)}", "error", wallet_address, "save_bad_private_key")
             
@@ -246,43 +368,46 @@ async def update_native_balance_in_excel(wallet_address: str, balance: str, priv
         return
         
     try:
-        async with file_lock:
-            wb = openpyxl.load_workbook(ACCOUNTS_PATH)
-            ws = wb.active
-            
-            col_map = get_excel_column_mapping(ws)
+        async with file_locks[ACCOUNTS_PATH]:
+            col_map = await get_cached_column_mapping(ACCOUNTS_PATH)
             
             balance_col_idx = col_map.get(COL_NATIVE_BALANCE)
             if balance_col_idx is None:
                 return
-                
+            
             address_col_idx = col_map.get(COL_ADDRESS)
             private_key_col_idx = col_map.get(COL_PRIVATE_KEY)
             
-            wallet_address_found = False
+            target_row_idx = None
+            private_key_row_idx = None
+            wallet_address_lower = wallet_address.lower()
+            match_private_key = bool(private_key) and private_key_col_idx is not None
             
-            if address_col_idx is not None:
-                for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=False), 2):
-                    cell = row[address_col_idx]
-                    if cell.value and str(cell.value).lower() == wallet_address.lower():
-                        ws.cell(row=row_idx, column=balance_col_idx + 1).value = balance
-                        wallet_address_found = True
+            for row_idx, row in enumerate(await _read_account_rows(), 2):
+                if address_col_idx is not None and address_col_idx < len(row):
+                    value = row[address_col_idx]
+                    if value and (value if isinstance(value, str) else str(value)).lower() == wallet_address_lower:
+                        target_row_idx = row_idx
                         break
+                if match_private_key and private_key_row_idx is None and private_key_col_idx < len(row):
+                    value = row[private_key_col_idx]
+                    if value and (value if isinstance(value, str) else str(value)).strip() == private_key:
+                        private_key_row_idx = row_idx
+                        if address_col_idx is None:
+                            break
             
-            if not wallet_address_found and private_key and private_key_col_idx is not None:
-                for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=False), 2):
-                    cell = row[private_key_col_idx]
-                    if cell.value and str(cell.value).strip() == private_key:
-                        ws.cell(row=row_idx, column=balance_col_idx + 1).value = balance
-                        
-                        if address_col_idx is not None:
-                            ws.cell(row=row_idx, column=address_col_idx + 1).value = wallet_address
-                            
-                        wallet_address_found = True
-                        break
+            write_address = False
+            if target_row_idx is None and private_key_row_idx is not None:
+                target_row_idx = private_key_row_idx
+                write_address = address_col_idx is not None
                         
-            if wallet_address_found:
-                wb.save(ACCOUNTS_PATH)
+            if target_row_idx is not None:
+                wb = await _load_accounts_workbook()
+                ws = wb.active
+                ws.cell(row=target_row_idx, column=balance_col_idx + 1).value = balance
+                if write_address:
+                    ws.cell(row=target_row_idx, column=address_col_idx + 1).value = wallet_address
+                await _save_accounts_workbook(wb)
                 await logger.logger_msg(f"Updated native balance for {wallet_address} to {balance}", "info", wallet_address)
             else:
                 await logger.logger_msg(f"Wallet address or private key not found in Excel", "warning", wallet_address, "update_native_balance_in_excel")
@@ -3,8 +3,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Generator
 
-import openpyxl
 from better_proxy import Proxy
+from python_calamine import CalamineWorkbook
 from ruamel.yaml import YAML
 
 from config.settings import shuffle_flag
@@ -76,9 +76,8 @@ class ConfigLoader:
         if not accounts_path.exists():
             raise ConfigurationError(f'Accounts file not found: {accounts_path}')
         
-        wb = openpyxl.load_workbook(accounts_path, read_only=True)
-        ws = wb.active
-        rows = ws.iter_rows(values_only=True)
+        wb = CalamineWorkbook.from_path(str(accounts_path))
+        rows = iter(wb.get_sheet_by_index(0).to_python())
         
         try:
             header = next(rows)
@@ -102,38 +101,33 @@ class ConfigLoader:
             and telegram_session_dir.is_dir()
         )
         
+        private_key_idx = col_map['Private Key']
+        proxy_idx = col_map.get('Proxy')
+        twitter_token_idx = col_map.get('Twitter Token')
+        reconnect_twitter_idx = col_map.get('Reconnect Twitter')
+        discord_token_idx = col_map.get('Discord Token')
+        reconnect_discord_idx = col_map.get('Reconnect Discord')
+        
         for row in rows:
-            if all(cell is None or str(cell).strip() == '' for cell in row):
+            if not any(row):
                 continue
             
-            private_key = row[col_map['Private Key']]
+            private_key = row[private_key_idx]
             if not private_key or str(private_key).strip() == '':
                 continue
             
             private_key = str(private_key).strip()
-            proxy_str = (
-                row[col_map.get('Proxy')] 
-                if 'Proxy' in col_map 
-                else None
-            )
-            twitter_token = (
-                row[col_map.get('Twitter Token')] 
-                if 'Twitter Token' in col_map 
-                else None
-            )
+            proxy_str = row[proxy_idx] if proxy_idx is not None else None
+            twitter_token = row[twitter_token_idx] if twitter_token_idx is not None else None
             reconnect_twitter = (
-                int(row[col_map['Reconnect Twitter']]) 
-                if 'Reconnect Twitter' in col_map and row[col_map['Reconnect Twitter']] is not None 
+                int(row[reconnect_twitter_idx]) 
+                if reconnect_twitter_idx is not None and row[reconnect_twitter_idx] not in (None, '') 
                 else 0
             )
-            discord_token = (
-                row[col_map.get('Discord Token')] 
-                if 'Discord Token' in col_map 
-                else None
-            )
+            discord_token = row[discord_token_idx] if discord_token_idx is not None else None
             reconnect_discord = (
-                int(row[col_map['Reconnect Discord']]) 
-                if 'Reconnect Discord' in col_map and row[col_map['Reconnect Discord']] is not None 
+                int(row[reconnect_discord_idx]) 
+                if reconnect_discord_idx is not None and row[reconnect_discord_idx] not in (None, '') 
                 else 0
             )
             
@@ -0,0 +1,73 @@
+import asyncio
+from typing import Any, Sequence
+
+from eth_abi import decode
+from eth_utils.abi import get_abi_output_types
+from web3 import AsyncWeb3
+from web3.contract import AsyncContract
+from web3.contract.async_contract import AsyncContractFunction
+from web3.exceptions import Web3Exception
+
+from config.settings import MULTICALL3_ADDRESSES
+from src.models import Multicall3Contract
+
+
+_DEPLOYED: dict[int, bool] = {}
+
+
+class MulticallError(Exception):
+    """Raised when an aggregate3 batch or a call inside it fails"""
+
+
+async def get_multicall(wallet: AsyncWeb3) -> AsyncContract | None:
+    """Multicall3 configured for the wallet's chain, or None when it has no code there"""
+    chain_id = await wallet.eth.chain_id
+    address = MULTICALL3_ADDRESSES.get(chain_id)
+    if address is None:
+        return None
+
+    address = AsyncWeb3.to_checksum_address(address)
+    if (deployed := _DEPLOYED.get(chain_id)) is None:
+        deployed = _DEPLOYED[chain_id] = bool(await wallet.eth.get_code(address))
+    return await wallet.get_contract(Multicall3Contract(address)) if deployed else None
+
+
+async def aggregate3(
+    multicall: AsyncContract,
+    calls: Sequence[AsyncContractFunction]
+) -> list[Any]:
+    """Executes view calls in a single eth_call and decodes the raw eth_abi values.
+
+    Unlike `.call()`, web3's return normalizers are not applied, so addresses come back
+    lowercase. Calldata comes from `ContractFunction._encode_transaction_data`, which is
+    private API as of web3 7.10.
+    """
+    payload = [
+        (call.address, False, call._encode_transaction_data())
+        for call in calls
+    ]
+    try:
+        results = await multicall.functions.aggregate3(payload).call()
+    except Web3Exception as e:
+        raise MulticallError(f"aggregate3 on {multicall.address} failed: {e}") from e
+
+    decoded = []
+    for call, (success, return_data) in zip(calls, results):
+        if not success:
+            raise MulticallError(f"Multicall to {call.address} ({call.fn_name}) reverted")
+        values = decode(get_abi_output_types(call.abi), return_data)
+        decoded.append(values[0] if len(values) == 1 else list(values))
+    return decoded
+
+
+async def batch_call(
+    multicall: AsyncContract | None,
+    calls: Sequence[AsyncContractFunction]
+) -> list[Any]:
+    """aggregate3 when Multicall3 is available, one `.call()` per function otherwise"""
+    if multicall is not None:
+        try:
+            return await aggregate3(multicall, calls)
+        except MulticallError:
+            pass
+    return list(await asyncio.gather(*(call.call() for call in calls)))
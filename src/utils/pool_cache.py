@@ -0,0 +1,62 @@
+import asyncio
+from pathlib import Path
+
+import orjson
+
+
+CACHE_PATH = Path(__file__).parent.parent.parent / "cache" / "quick_pools.json"
+
+
+class PoolCache:
+    """On-disk cache of pool addresses by token pair"""
+
+    def __init__(self, path: Path = CACHE_PATH) -> None:
+        self.path = path
+        self._pairs: dict[str, str] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _pair_key(token_a: str, token_b: str) -> str:
+        return f"{token_a.lower()}:{token_b.lower()}"
+
+    async def load(self) -> None:
+        async with self._lock:
+            if self._loaded:
+                return
+            if self.path.exists():
+                try:
+                    content = orjson.loads(await asyncio.to_thread(self.path.read_bytes))
+                    self._pairs.update(
+                        (pair, address) for pair, address in content.get("pairs", {}).items()
+                        if int(address, 16)
+                    )
+                except (orjson.JSONDecodeError, AttributeError, TypeError, ValueError):
+                    pass
+            self._loaded = True
+
+    def get_pair(self, token_a: str, token_b: str) -> str | None:
+        return self._pairs.get(self._pair_key(token_a, token_b))
+
+    def set_pair(self, token_a: str, token_b: str, pool_address: str) -> None:
+        self._pairs[self._pair_key(token_a, token_b)] = pool_address
+        self._dirty = True
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._dirty:
+                return
+            content = orjson.dumps(
+                {"pairs": self._pairs},
+                option=orjson.OPT_INDENT_2
+            )
+            await asyncio.to_thread(self._write, content)
+            self._dirty = False
+
+    def _write(self, content: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(content)
+
+
+pool_cache = PoolCache()
@@ -0,0 +1,65 @@
+from typing import Awaitable, Callable, TypeVar
+
+from web3.exceptions import ContractLogicError
+
+from config.settings import RETRY_SLEEP_RANGE
+from src.exceptions.custom_exceptions import PoolNotFoundError
+from .utils import random_sleep
+
+
+NON_RETRYABLE_ERRORS = (ContractLogicError, PoolNotFoundError)
+FATAL_ERROR_MARKERS = (
+    "insufficient funds",
+    "invalid signature",
+    "invalid sender",
+    "exceeds block gas limit",
+)
+
+T = TypeVar("T")
+
+
+class RetryError(Exception):
+    """Raised by an attempt whose result should be retried"""
+
+
+def is_fatal_message(message: str) -> bool:
+    """Node errors like insufficient funds won't clear up on a retry"""
+    message = message.lower()
+    return any(marker in message for marker in FATAL_ERROR_MARKERS)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Reverts and fatal node errors fail the same way on every attempt"""
+    return not any(
+        isinstance(exc, NON_RETRYABLE_ERRORS) or is_fatal_message(str(exc))
+        for exc in (error, error.__cause__)
+        if exc is not None
+    )
+
+
+async def backoff_sleep(
+    address: str | None,
+    attempt: int,
+    sleep_range: tuple[float, float] = RETRY_SLEEP_RANGE
+) -> None:
+    """Sleeps min(max, min * 2**attempt) seconds with ±50% jitter"""
+    base, cap = sleep_range
+    delay = min(cap, base * 2 ** attempt)
+    await random_sleep(address, delay * 0.5, delay * 1.5)
+
+
+async def retry_async(
+    fn: Callable[[int], Awaitable[T]],
+    *,
+    attempts: int,
+    address: str | None = None,
+    sleep_range: tuple[float, float] = RETRY_SLEEP_RANGE
+) -> T:
+    """Awaits fn(attempt) until it returns, re-raising fatal errors and the last one once attempts run out"""
+    for attempt in range(attempts):
+        try:
+            return await fn(attempt)
+        except Exception as e:
+            if attempt == attempts - 1 or not is_retryable(e):
+                raise
+        await backoff_sleep(address, attempt, sleep_range)
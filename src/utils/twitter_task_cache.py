@@ -0,0 +1,63 @@
+import asyncio
+import hashlib
+from pathlib import Path
+
+import orjson
+
+
+CACHE_PATH = Path(__file__).parent.parent.parent / "cache" / "twitter_tasks.json"
+
+
+class TwitterTaskCache:
+    """On-disk record of Twitter actions already completed per auth token"""
+
+    def __init__(self, path: Path = CACHE_PATH) -> None:
+        self.path = path
+        self._completed: set[str] = set()
+        self._loaded = False
+        self._dirty = False
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _key(auth_token: str, action: str, target: int | str) -> str:
+        token_hash = hashlib.sha256(auth_token.encode()).hexdigest()
+        return f"{token_hash}:{action}:{target}"
+
+    async def load(self) -> None:
+        async with self._lock:
+            if self._loaded:
+                return
+            if self.path.exists():
+                try:
+                    content = orjson.loads(await asyncio.to_thread(self.path.read_bytes))
+                    self._completed.update(content.get("completed", []))
+                except (orjson.JSONDecodeError, AttributeError):
+                    pass
+            self._loaded = True
+
+    def has(self, auth_token: str, action: str, target: int | str) -> bool:
+        return self._key(auth_token, action, target) in self._completed
+
+    def add(self, auth_token: str, action: str, target: int | str) -> None:
+        key = self._key(auth_token, action, target)
+        if key not in self._completed:
+            self._completed.add(key)
+            self._dirty = True
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._dirty:
+                return
+            content = orjson.dumps(
+                {"completed": sorted(self._completed)},
+                option=orjson.OPT_INDENT_2
+            )
+            await asyncio.to_thread(self._write, content)
+            self._dirty = False
+
+    def _write(self, content: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(content)
+
+
+twitter_task_cache = TwitterTaskCache()
@@ -1,128 +1,265 @@
+import asyncio
+import re
+
 import twitter
 
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Self
+from typing import ClassVar, Self
 
 from src.models import Account
 from src.wallet import Wallet
 from src.logger import AsyncLogger
-from src.utils import check_twitter_error_for_invalid_token
+from src.utils import backoff_sleep, check_twitter_error_for_invalid_token, twitter_task_cache
+
+
+TWITTER_BACKOFF_RANGE = (1.0, 30.0)
+TWITTER_RATE_LIMIT_SLEEP = 30.0
+TWITTER_RETRY_AFTER_MAX = 300.0
+# Codes worth checking the auth token for: bad/expired token, suspended or locked account
+TWITTER_AUTH_ERROR_CODES = frozenset({32, 64, 89, 135, 215, 326})
+# Tweet deleted/not found, account suspended, invalid token: retrying cannot help
+RETWEET_FATAL_CODES = frozenset({34, 64, 89, 144})
+
+
+# Auth tokens found invalid during this run
+_DEAD_TOKENS: set[str] = set()
+_ERROR_CODE_RE = re.compile(r'"code"\s*:\s*(\d+)')
+
+
+def _api_error_codes(error: Exception) -> set[int]:
+    """Twitter error codes from the exception, falling back to the errors JSON in its message"""
+    codes = getattr(error, "api_codes", None)
+    if codes:
+        return set(codes)
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return {code}
+    return {int(code) for code in _ERROR_CODE_RE.findall(str(error))}
+
+
+def _is_rate_limited(error: Exception | None) -> bool:
+    if error is None:
+        return False
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None) or getattr(response, "status", None)
+    return status == 429 or 88 in _api_error_codes(error)
+
+
+def _retry_after(error: Exception | None) -> float | None:
+    """Seconds the server asked us to wait, if the error carries a Retry-After header"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    try:
+        return min(max(float(value), 0.0), TWITTER_RETRY_AFTER_MAX) if value else None
+    except ValueError:
+        return None
 
 
 class TwitterWorker(Wallet, AsyncLogger):
+    _graphql_endpoints: ClassVar[dict[str, tuple[str, str]]] = {}
+    _FOLLOW_URL: ClassVar[str] = "https://x.com/i/api/1.1/friendships/create.json"
+    _FOLLOW_PAYLOAD: ClassVar[dict[str, str]] = {
+        "include_profile_interstitial_type": "1",
+        "include_blocking": "1",
+        "include_blocked_by": "1",
+        "include_followed_by": "1",
+        "include_want_retweets": "1",
+        "include_mute_edge": "1",
+        "include_can_dm": "1",
+        "include_can_media_tag": "1",
+        "include_ext_is_blue_verified": "1",
+        "include_ext_verified_type": "1",
+        "include_ext_profile_image_shape": "1",
+        "skip_status": "1",
+    }
+
     def __init__(self, account: Account) -> None:
         Wallet.__init__(self, account.private_key, account.proxy)
         AsyncLogger.__init__(self)
         
         self.account: Account = account
         self.twitter_account: twitter.Account | None = None
+        self._client: twitter.Client | None = None
 
     async def __aenter__(self) -> Self:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.__aexit__(exc_type, exc_val, exc_tb)
+            await self.logger_msg(
+                msg=f"Twitter client connection closed", type_msg="debug", 
+                address=self.wallet_address
+            )
         await super().__aexit__(exc_type, exc_val, exc_tb)
 
-    @asynccontextmanager
-    async def _get_twitter_client(self) -> AsyncGenerator[twitter.Client | None, None]:
+    async def _ensure_client(self) -> twitter.Client | None:
+        if self._client is not None:
+            return self._client
+        if self.account.auth_tokens_twitter in _DEAD_TOKENS:
+            await self.logger_msg(
+                msg=f"Twitter token was already found invalid, skipping", type_msg="warning", 
+                address=self.wallet_address
+            )
+            return None
+
         self.twitter_account = twitter.Account(auth_token=self.account.auth_tokens_twitter)
-        client: twitter.Client | None = None
+        client = twitter.Client(
+            self.twitter_account,
+            proxy=str(self.account.proxy) if self.account.proxy else None
+        )
 
         try:
             await self.logger_msg(
                 msg=f"Initializing Twitter client", type_msg="info", address=self.wallet_address
             )
 
-            async with twitter.Client(
-                self.twitter_account,
-                proxy=str(self.account.proxy) if self.account.proxy else None
-            ) as client:
+            await client.__aenter__()
+            try:
                 await client.update_account_info()
+            except Exception:
+                await client.__aexit__(None, None, None)
+                raise
 
-                await self.logger_msg(
-                    msg=f"Account: {self.wallet_address} | Twitter client initialized successfully. "
-                    f"Logged in as @{self.twitter_account.username}", type_msg="success"
-                )
+            await self.logger_msg(
+                msg=f"Account: {self.wallet_address} | Twitter client initialized successfully. "
+                f"Logged in as @{self.twitter_account.username}", type_msg="success"
+            )
 
-                yield client
+            self._client = client
+            return client
 
         except Exception as error:
             await self.logger_msg(
                 msg=f"Twitter client error: {error}", type_msg="error", 
-                address=self.wallet_address, method_name="_get_twitter_client"
+                address=self.wallet_address, method_name="_ensure_client"
             )
-            await check_twitter_error_for_invalid_token(error, self.account.auth_tokens_twitter, self.wallet_address)
-            yield None
+            await self._token_is_invalid(error, _api_error_codes(error))
+            return None
+
+    async def _token_is_invalid(self, error: Exception, error_codes: set[int]) -> bool:
+        """Runs the bad-token check only for auth-related or uncoded errors and remembers dead tokens"""
+        if error_codes and not error_codes & TWITTER_AUTH_ERROR_CODES:
+            return False
+        token = self.account.auth_tokens_twitter
+        if await check_twitter_error_for_invalid_token(error, token, self.wallet_address):
+            _DEAD_TOKENS.add(token)
+            return True
+        return False
+
+    @classmethod
+    def _graphql_endpoint(cls, client: twitter.Client, action: str) -> tuple[str, str]:
+        endpoint = cls._graphql_endpoints.get(action)
+        if endpoint is None:
+            query_id = client._ACTION_TO_QUERY_ID[action]
+            endpoint = cls._graphql_endpoints[action] = (query_id, f"{client._GRAPHQL_URL}/{query_id}/{action}")
+        return endpoint
+
+    async def _retry_pause(self, attempt: int, error: Exception | None) -> None:
+        delay = _retry_after(error)
+        if delay is None and _is_rate_limited(error):
+            delay = TWITTER_RATE_LIMIT_SLEEP
+        if delay is not None:
+            await self.logger_msg(
+                msg=f"Twitter asked to slow down, waiting {delay:.0f}s", 
+                type_msg="warning", address=self.wallet_address
+            )
+            await asyncio.sleep(delay)
+        else:
+            await backoff_sleep(self.wallet_address, attempt, TWITTER_BACKOFF_RANGE)
+
+    async def _remember_retweet(self, tweet_id: int) -> None:
+        twitter_task_cache.add(self.account.auth_tokens_twitter, "retweet", tweet_id)
+        await twitter_task_cache.flush()
 
-        finally:
-            if client:
-                await self.logger_msg(
-                    msg=f"Twitter client connection closed", type_msg="debug", 
-                    address=self.wallet_address
-                )
-                
     async def retweet_tweet(self, tweet_id: int) -> bool:
+        address = self.wallet_address
         await self.logger_msg(
             msg=f"Trying to retweet the post with ID: {tweet_id}", type_msg="info", 
-            address=self.wallet_address
+            address=address
         )
+        
+        await twitter_task_cache.load()
+        if twitter_task_cache.has(self.account.auth_tokens_twitter, "retweet", tweet_id):
+            await self.logger_msg(
+                msg=f"You previously retweeted this tweet, so the task has already been completed", 
+                type_msg="success", address=address
+            )
+            return True
 
-        async with self._get_twitter_client() as client:
-            if not client:
-                return False
+        client = await self._ensure_client()
+        if not client:
+            return False
 
-            for attempt in range(3):
+        for attempt in range(3):
+            last_error: Exception | None = None
+            try:
+                await self.logger_msg(
+                    msg=f"Retweet attempt {attempt+1}/3 for tweet ID: {tweet_id}", 
+                    type_msg="info", address=address
+                )
+                
+                query_id, url = self._graphql_endpoint(client, 'CreateRetweet')
+                json_payload = {
+                    "variables": {"tweet_id": tweet_id, "dark_request": False},
+                    "queryId": query_id,
+                }
+                
                 try:
-                    await self.logger_msg(
-                        msg=f"Retweet attempt {attempt+1}/3 for tweet ID: {tweet_id}", 
-                        type_msg="info", address=self.wallet_address
-                    )
-                    
-                    query_id = client._ACTION_TO_QUERY_ID['CreateRetweet']
-                    url = f"{client._GRAPHQL_URL}/{query_id}/CreateRetweet"
-                    
-                    json_payload = {
-                        "variables": {"tweet_id": tweet_id, "dark_request": False},
-                        "queryId": query_id,
-                    }
+                    response, data = await client.request("POST", url, json=json_payload)
                     
-                    try:
-                        response, data = await client.request("POST", url, json=json_payload)
-                        
-                        if "data" in data and "create_retweet" in data["data"] and "retweet_results" in data["data"]["create_retweet"]:
-                            retweet_id = data["data"]["create_retweet"]["retweet_results"]["result"]["rest_id"]
-                            await self.logger_msg(
-                                msg=f"Successfully retweeted. Retweet ID: {retweet_id}", type_msg="success", 
-                                address=self.wallet_address
-                            )
-                            return True
-                            
-                    except Exception as api_error:
-                        error_str = str(api_error)
-                        if "327" in error_str or "You have already retweeted this Tweet" in error_str:
-                            await self.logger_msg(
-                                msg=f"You previously retweeted this tweet, so the task has already been completed", 
-                                type_msg="success", address=self.wallet_address
-                            )
-                            return True
+                    if "data" in data and "create_retweet" in data["data"] and "retweet_results" in data["data"]["create_retweet"]:
+                        retweet_id = data["data"]["create_retweet"]["retweet_results"]["result"]["rest_id"]
+                        await self.logger_msg(
+                            msg=f"Successfully retweeted. Retweet ID: {retweet_id}", type_msg="success", 
+                            address=address
+                        )
+                        await self._remember_retweet(tweet_id)
+                        return True
                         
-                        is_invalid_token = await check_twitter_error_for_invalid_token(api_error, self.account.auth_tokens_twitter, self.wallet_address)
-                        if is_invalid_token:
-                            return False
+                except Exception as api_error:
+                    last_error = api_error
+                    error_str = str(api_error)
+                    error_codes = _api_error_codes(api_error)
+                    if 327 in error_codes or "You have already retweeted this Tweet" in error_str:
+                        await self.logger_msg(
+                            msg=f"You previously retweeted this tweet, so the task has already been completed", 
+                            type_msg="success", address=address
+                        )
+                        await self._remember_retweet(tweet_id)
+                        return True
+                    
+                    if await self._token_is_invalid(api_error, error_codes):
+                        return False
 
-                except Exception as outer_error:
-                    await self.logger_msg(
-                        msg=f"Unexpected error: {outer_error}", type_msg="error", 
-                        address=self.wallet_address, method_name="retweet_tweet"
-                    )
-                    if attempt == 2:
+                    fatal_codes = error_codes & RETWEET_FATAL_CODES
+                    if fatal_codes:
+                        await self.logger_msg(
+                            msg=f"Retweet of {tweet_id} cannot succeed (error code {min(fatal_codes)}): {error_str}", 
+                            type_msg="error", address=address, method_name="retweet_tweet"
+                        )
                         return False
 
-            await self.logger_msg(
-                msg=f"Failed to retweet a tweet even after three attempts", type_msg="error", 
-                address=self.wallet_address, method_name="retweet_tweet"
-            )
-            return False
+            except Exception as outer_error:
+                last_error = outer_error
+                await self.logger_msg(
+                    msg=f"Unexpected error: {outer_error}", type_msg="error", 
+                    address=address, method_name="retweet_tweet"
+                )
+                if attempt == 2:
+                    return False
+            
+            if attempt < 2:
+                await self._retry_pause(attempt, last_error)
+
+        await self.logger_msg(
+            msg=f"Failed to retweet a tweet even after three attempts", type_msg="error", 
+            address=address, method_name="retweet_tweet"
+        )
+        return False
         
     async def like_tweet(self, tweet_id: int) -> bool:
         await self.logger_msg(
@@ -131,84 +268,84 @@ class TwitterWorker(Wallet, AsyncLogger):
             address=self.wallet_address
         )
         
-        async with self._get_twitter_client() as client:
-            if not client:
+        client = await self._ensure_client()
+        if not client:
+            await self.logger_msg(
+                msg=f"Failed to initialize Twitter client for like", 
+                type_msg="error", 
+                address=self.wallet_address, 
+                method_name="like_tweet"
+            )
+            return False
+
+        for attempt in range(3):
+            last_error: Exception | None = None
+            try:
                 await self.logger_msg(
-                    msg=f"Failed to initialize Twitter client for like", 
-                    type_msg="error", 
-                    address=self.wallet_address, 
-                    method_name="like_tweet"
+                    msg=f"Like attempt {attempt+1}/3 for tweet ID: {tweet_id}", 
+                    type_msg="info", address=self.wallet_address
                 )
-                return False
-
-            for attempt in range(3):
+                
+                query_id, url = self._graphql_endpoint(client, 'FavoriteTweet')
+                json_payload = {
+                    "variables": {"tweet_id": str(tweet_id)},
+                    "queryId": query_id,
+                }
+                
                 try:
-                    await self.logger_msg(
-                        msg=f"Like attempt {attempt+1}/3 for tweet ID: {tweet_id}", 
-                        type_msg="info", address=self.wallet_address
-                    )
-                    
-                    query_id = client._ACTION_TO_QUERY_ID.get('FavoriteTweet')
-                    url = f"{client._GRAPHQL_URL}/{query_id}/FavoriteTweet"
-                    
-                    json_payload = {
-                        "variables": {"tweet_id": str(tweet_id)},
-                        "queryId": query_id,
-                    }
+                    response, data = await client.request("POST", url, json=json_payload)
                     
-                    try:
-                        response, data = await client.request("POST", url, json=json_payload)
-                        
-                        if data.get("data", {}).get("favorite_tweet") == "Done":
-                            await self.logger_msg(
-                                msg=f"Successfully liked tweet {tweet_id}", 
-                                type_msg="success", 
-                                address=self.wallet_address
-                            )
-                            return True
-                            
-                    except Exception as api_error:
-                        error_str = str(api_error)
-                        if "139" in error_str or "Already favorited" in error_str:
-                            await self.logger_msg(
-                                msg=f"Tweet already liked", 
-                                type_msg="success", 
-                                address=self.wallet_address
-                            )
-                            return True
-                        
-                        is_invalid_token = await check_twitter_error_for_invalid_token(
-                            api_error, 
-                            self.account.auth_tokens_twitter, 
-                            self.wallet_address
+                    if data.get("data", {}).get("favorite_tweet") == "Done":
+                        await self.logger_msg(
+                            msg=f"Successfully liked tweet {tweet_id}", 
+                            type_msg="success", 
+                            address=self.wallet_address
                         )
-                        if is_invalid_token:
-                            return False
-
+                        return True
+                        
+                except Exception as api_error:
+                    last_error = api_error
+                    error_str = str(api_error)
+                    error_codes = _api_error_codes(api_error)
+                    if 139 in error_codes or "Already favorited" in error_str:
                         await self.logger_msg(
-                            msg=f"Attempt {attempt+1}/3 failed. API error: {error_str}", 
-                            type_msg="error", 
-                            address=self.wallet_address, 
-                            method_name="like_tweet"
+                            msg=f"Tweet already liked", 
+                            type_msg="success", 
+                            address=self.wallet_address
                         )
+                        return True
+                    
+                    if await self._token_is_invalid(api_error, error_codes):
+                        return False
 
-                except Exception as outer_error:
                     await self.logger_msg(
-                        msg=f"Unexpected error: {outer_error}", 
+                        msg=f"Attempt {attempt+1}/3 failed. API error: {error_str}", 
                         type_msg="error", 
                         address=self.wallet_address, 
                         method_name="like_tweet"
                     )
-                    if attempt == 2:
-                        return False
 
-            await self.logger_msg(
-                msg=f"Failed to like tweet after 3 attempts", 
-                type_msg="error", 
-                address=self.wallet_address, 
-                method_name="like_tweet"
-            )
-            return False
+            except Exception as outer_error:
+                last_error = outer_error
+                await self.logger_msg(
+                    msg=f"Unexpected error: {outer_error}", 
+                    type_msg="error", 
+                    address=self.wallet_address, 
+                    method_name="like_tweet"
+                )
+                if attempt == 2:
+                    return False
+
+            if attempt < 2:
+                await self._retry_pause(attempt, last_error)
+
+        await self.logger_msg(
+            msg=f"Failed to like tweet after 3 attempts", 
+            type_msg="error", 
+            address=self.wallet_address, 
+            method_name="like_tweet"
+        )
+        return False
         
     async def follow_user(self, user_id: int) -> bool:
         await self.logger_msg(
@@ -217,99 +354,85 @@ class TwitterWorker(Wallet, AsyncLogger):
             address=self.wallet_address
         )
         
-        async with self._get_twitter_client() as client:
-            if not client:
+        client = await self._ensure_client()
+        if not client:
+            await self.logger_msg(
+                msg=f"Failed to initialize Twitter client for follow", 
+                type_msg="error", 
+                address=self.wallet_address, 
+                method_name="follow_user"
+            )
+            return False
+
+        follow_payload = dict(self._FOLLOW_PAYLOAD, user_id=str(user_id))
+        for attempt in range(3):
+            last_error: Exception | None = None
+            try:
                 await self.logger_msg(
-                    msg=f"Failed to initialize Twitter client for follow", 
-                    type_msg="error", 
-                    address=self.wallet_address, 
-                    method_name="follow_user"
+                    msg=f"Follow attempt {attempt+1}/3 for user ID: {user_id}", 
+                    type_msg="info", address=self.wallet_address
                 )
-                return False
-
-            for attempt in range(3):
+                
                 try:
-                    await self.logger_msg(
-                        msg=f"Follow attempt {attempt+1}/3 for user ID: {user_id}", 
-                        type_msg="info", address=self.wallet_address
-                    )
-                    
-                    url = "https://x.com/i/api/1.1/friendships/create.json"
-                    data = {
-                        "include_profile_interstitial_type": "1",
-                        "include_blocking": "1",
-                        "include_blocked_by": "1",
-                        "include_followed_by": "1",
-                        "include_want_retweets": "1",
-                        "include_mute_edge": "1",
-                        "include_can_dm": "1",
-                        "include_can_media_tag": "1",
-                        "include_ext_is_blue_verified": "1",
-                        "include_ext_verified_type": "1",
-                        "include_ext_profile_image_shape": "1",
-                        "skip_status": "1",
-                        "user_id": str(user_id)
-                    }
+                    response, data = await client.request("POST", self._FOLLOW_URL, data=follow_payload)
                     
-                    try:
-                        response, data = await client.request("POST", url, data=data)
+                    if "id" in data and data["id"] == user_id:
+                        await self.logger_msg(
+                            msg=f"Successfully followed user {user_id}", 
+                            type_msg="success", 
+                            address=self.wallet_address
+                        )
+                        return True
                         
-                        if "id" in data and data["id"] == user_id:
-                            await self.logger_msg(
-                                msg=f"Successfully followed user {user_id}", 
-                                type_msg="success", 
-                                address=self.wallet_address
-                            )
-                            return True
-                            
-                    except Exception as api_error:
-                        error_str = str(api_error)
-                        if "108" in error_str or "You are unable to follow more people at this time" in error_str:
-                            await self.logger_msg(
-                                msg=f"Unable to follow user {user_id}: {error_str}", 
-                                type_msg="error", 
-                                address=self.wallet_address, 
-                                method_name="follow_user"
-                            )
-                            return False
-                        elif "160" in error_str or "You have already requested to follow" in error_str:
-                            await self.logger_msg(
-                                msg=f"Already requested to follow user {user_id}", 
-                                type_msg="success", 
-                                address=self.wallet_address
-                            )
-                            return True
-                        elif "162" in error_str or "You have been blocked from following this account" in error_str:
-                            await self.logger_msg(
-                                msg=f"Blocked from following user {user_id}", 
-                                type_msg="error", 
-                                address=self.wallet_address, 
-                                method_name="follow_user"
-                            )
-                            return False
-                        else:
-                            is_invalid_token = await check_twitter_error_for_invalid_token(
-                                api_error, 
-                                self.account.auth_tokens_twitter, 
-                                self.wallet_address
-                            )
-                            if is_invalid_token:
-                                return False
-
-                except Exception as outer_error:
-                    await self.logger_msg(
-                        msg=f"Unexpected error: {outer_error}", 
-                        type_msg="error", 
-                        address=self.wallet_address, 
-                        method_name="follow_user"
-                    )
-                    if attempt == 2:
+                except Exception as api_error:
+                    last_error = api_error
+                    error_str = str(api_error)
+                    error_codes = _api_error_codes(api_error)
+                    if 108 in error_codes or "You are unable to follow more people at this time" in error_str:
+                        await self.logger_msg(
+                            msg=f"Unable to follow user {user_id}: {error_str}", 
+                            type_msg="error", 
+                            address=self.wallet_address, 
+                            method_name="follow_user"
+                        )
                         return False
+                    elif 160 in error_codes or "You have already requested to follow" in error_str:
+                        await self.logger_msg(
+                            msg=f"Already requested to follow user {user_id}", 
+                            type_msg="success", 
+                            address=self.wallet_address
+                        )
+                        return True
+                    elif 162 in error_codes or "You have been blocked from following this account" in error_str:
+                        await self.logger_msg(
+                            msg=f"Blocked from following user {user_id}", 
+                            type_msg="error", 
+                            address=self.wallet_address, 
+                            method_name="follow_user"
+                        )
+                        return False
+                    else:
+                        if await self._token_is_invalid(api_error, error_codes):
+                            return False
 
-            await self.logger_msg(
-                msg=f"Failed to follow user after 3 attempts", 
-                type_msg="error", 
-                address=self.wallet_address, 
-                method_name="follow_user"
-            )
-            return False
\ No newline at end of file
+            except Exception as outer_error:
+                last_error = outer_error
+                await self.logger_msg(
+                    msg=f"Unexpected error: {outer_error}", 
+                    type_msg="error", 
+                    address=self.wallet_address, 
+                    method_name="follow_user"
+                )
+                if attempt == 2:
+                    return False
+
+            if attempt < 2:
+                await self._retry_pause(attempt, last_error)
+
+        await self.logger_msg(
+            msg=f"Failed to follow user after 3 attempts", 
+            type_msg="error", 
+            address=self.wallet_address, 
+            method_name="follow_user"
+        )
+        return False
\ No newline at end of file
@@ -1,22 +1,30 @@
 import asyncio
 import random
+from functools import lru_cache
 
-from eth_account import Account
+from coincurve import PublicKey
+from eth_utils import keccak, to_checksum_address
 from faker import Faker
 
 from src.logger import AsyncLogger
 
 
+_LOGGER = AsyncLogger()
+
+
+@lru_cache(maxsize=16)
+def _faker(locale: str) -> Faker:
+    return Faker(locale)
+
+
 def generate_username(locale='en_US'):
-    faker = Faker(locale)
-    return faker.user_name()
+    return _faker(locale).user_name()
 
 async def random_sleep(
     address: str | None = None, 
     min_sec: int = 30, 
     max_sec: int = 60
 ) -> None:
-    logger = AsyncLogger()
     delay = random.uniform(min_sec, max_sec)
     
     minutes, seconds = divmod(delay, 60)
@@ -25,26 +33,22 @@ async def random_sleep(
         f"{int(minutes)} minutes {seconds:.1f} seconds" if minutes > 0 else 
         f"Sleep {seconds:.1f} seconds"
     )
-    await logger.logger_msg(template, type_msg="info", address=address)
-    
-    chunk_size = 0.1
-    chunks = int(delay / chunk_size)
-    remainder = delay - (chunks * chunk_size)
+    await _LOGGER.logger_msg(template, type_msg="info", address=address)
     
     try:
-        for _ in range(chunks):
-            await asyncio.sleep(chunk_size)
-            
-        if remainder > 0:
-            await asyncio.sleep(remainder)
-            
+        await asyncio.sleep(delay)
     except asyncio.CancelledError:
-        await logger.logger_msg(
+        await _LOGGER.logger_msg(
             f"Sleep interrupted", type_msg="warning", address=address
         )
         raise
 
-_ACCOUNT = Account()
 
-def get_address(private_key: str) -> str:    
-    return _ACCOUNT.from_key(private_key).address
\ No newline at end of file
+def address_from_key(private_key: bytes) -> str:
+    public_key = PublicKey.from_valid_secret(private_key).format(compressed=False)[1:]
+    return to_checksum_address(keccak(public_key)[-20:])
+
+
+@lru_cache(maxsize=None)
+def get_address(private_key: str) -> str:
+    return address_from_key(bytes.fromhex(private_key.removeprefix("0x")))
\ No newline at end of file
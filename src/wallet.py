@@ -1,8 +1,10 @@
 import asyncio
 import random
+import time
 from decimal import Decimal
 from typing import Any, Union, Self
 
+from aiohttp import ClientSession
 from better_proxy import Proxy
 from eth_account import Account
 from eth_account.messages import encode_defunct
@@ -31,6 +33,7 @@ class Wallet(AsyncWeb3, Account):
     ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
     DEFAULT_TIMEOUT = 60
     MAX_RETRIES = 3
+    BALANCE_CACHE_TTL = 5.0
     
     def __init__(
         self, 
@@ -53,6 +56,9 @@ class Wallet(AsyncWeb3, Account):
         self.private_key = self._initialize_private_key(private_key)
         self._contracts_cache: dict[str, AsyncContract] = {}
         self._is_closed = False
+        self._owns_session = True
+        self._nonce: int | None = None
+        self._balance_cache: tuple[float, float] | None = None
         
     async def __aenter__(self) -> Self:
         return self
@@ -60,12 +66,16 @@ class Wallet(AsyncWeb3, Account):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
         
+    async def use_shared_session(self, session: ClientSession) -> None:
+        await self._provider.cache_async_session(session)
+        self._owns_session = False
+        
     async def close(self):
         if self._is_closed:
             return
         
         try:
-            if self._provider:
+            if self._provider and self._owns_session:
                 if isinstance(self._provider, AsyncHTTPProvider):
                     await self._provider.disconnect()
                     await logger.logger_msg(
@@ -216,8 +226,11 @@ class Wallet(AsyncWeb3, Account):
             raise InsufficientFundsError("ETH balance is empty")
 
     async def human_balance(self) -> float:
-        balance = await self.eth.get_balance(self.private_key.address)
-        return float(self.from_wei(balance, "ether"))
+        if self._balance_cache and time.monotonic() - self._balance_cache[1] < self.BALANCE_CACHE_TTL:
+            return self._balance_cache[0]
+        balance = float(self.from_wei(await self.eth.get_balance(self.private_key.address), "ether"))
+        self._balance_cache = (balance, time.monotonic())
+        return balance
     
     async def has_sufficient_funds_for_tx(self, transaction: TxParams) -> bool:
         try:
@@ -291,7 +304,7 @@ class Wallet(AsyncWeb3, Account):
     ) -> dict:
         base_params = {
             "from": self.wallet_address,
-            "nonce": await self.get_nonce(),
+            "nonce": self._nonce if self._nonce is not None else await self.get_nonce(),
             "value": value,
             **kwargs
         }
@@ -354,6 +367,9 @@ class Wallet(AsyncWeb3, Account):
             try:
                 signed = self.private_key.sign_transaction(transaction)
                 tx_hash = await self.eth.send_raw_transaction(signed.raw_transaction)
+                self._balance_cache = None
+                if 'nonce' in transaction:
+                    self._nonce = transaction['nonce'] + 1
                 
                 receipt = await asyncio.wait_for(
                     self.eth.wait_for_transaction_receipt(tx_hash),
@@ -377,6 +393,11 @@ class Wallet(AsyncWeb3, Account):
                 last_error = error
                 current_attempt += 1
                 
+                if "NONCE_TOO_SMALL" in error_str or any(
+                    marker in error_str.lower() for marker in ("nonce too low", "already known")
+                ):
+                    self._nonce = None
+                
                 if "NONCE_TOO_SMALL" in error_str or "nonce too low" in error_str.lower():
                     await logger.logger_msg(
                         msg=f"Nonce too small. Current: {transaction.get('nonce')}. Getting new nonce.", 